@@ -62,6 +62,15 @@ PLATFORMS = [Platform.DEVICE_TRACKER, Platform.SENSOR, Platform.BINARY_SENSOR]
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+
+def _create_config_dirs(hass: HomeAssistant) -> None:
+    """Create config directories if they don't exist (runs in executor)."""
+    for directory in [PROXY_CONFIG_DIR, BEACON_CONFIG_DIR, ZONE_CONFIG_DIR]:
+        config_dir = Path(hass.config.path(directory))
+        if not config_dir.exists():
+            _LOGGER.info(f"Creating configuration directory: {config_dir}")
+            config_dir.mkdir(parents=True, exist_ok=True)
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the BLE Triangulation integration."""
     hass.data.setdefault(DOMAIN, {})
@@ -75,14 +84,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     }
 
     # Create config directories if they don't exist
-    for directory in [PROXY_CONFIG_DIR, BEACON_CONFIG_DIR, ZONE_CONFIG_DIR]:
-        config_dir = Path(hass.config.path(directory))
-        if not config_dir.exists():
-            _LOGGER.info(f"Creating configuration directory: {config_dir}")
-            config_dir.mkdir(parents=True, exist_ok=True)
+    await hass.async_add_executor_job(_create_config_dirs, hass)
 
     # Initialize manager
     manager = TriangulationManager(hass, entry)
+    await manager.zone_manager.async_load_zones()
     hass.data[DOMAIN][entry.entry_id][DATA_MANAGER] = manager
 
     # For backward compatibility with any code that might use 'manager' string key
@@ -437,7 +443,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         if results:
             # Create notification with results
-            await async_create_notification(
+            async_create_notification(
                 hass,
                 title=f"Calibration Results for {proxy_id}",
                 message=(
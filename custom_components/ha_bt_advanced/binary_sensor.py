@@ -1,5 +1,6 @@
 """Binary sensor platform for BLE Triangulation."""
 import logging
+from datetime import timedelta
 from typing import Any, Dict, Optional
 
 from homeassistant.components.binary_sensor import (
@@ -122,10 +123,16 @@ class BLEPresenceSensor(BinarySensorEntity):
         self._is_present = False
         self._last_seen = None
         self._attr_device_class = BinarySensorDeviceClass.PRESENCE
-        
-        # Register for updates
-        manager.register_update_callback(self._unique_id, self._async_update)
-        
+
+        # Updates are published under the beacon's tracker id
+        self._update_id = f"beacon_{beacon_id.lower().replace(':', '_')}"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to state updates once the entity is added."""
+        self.async_on_remove(
+            self._manager.register_update_callback(self._update_id, self._async_update)
+        )
+
     @property
     def name(self) -> str:
         """Return the name of the binary sensor."""
@@ -161,16 +168,14 @@ class BLEPresenceSensor(BinarySensorEntity):
     @callback
     def _async_update(self, data: Dict[str, Any]) -> None:
         """Update the binary sensor state."""
-        self._is_present = True  # If we receive an update, beacon is present
-        self._last_seen = data.get(ATTR_LAST_SEEN)
-        
-        # Check if beacon has been seen recently
-        if self._last_seen:
-            # For this basic implementation, we'll consider the beacon present
-            # The manager's _check_devices_status method will handle "missing" beacons
-            # and create notifications for them
-            self._is_present = True
-            
+        # If we receive an update, beacon is present; the manager's
+        # _check_devices_status handles beacons that go missing
+        last_seen = data.get(ATTR_LAST_SEEN)
+        if self._is_present and last_seen == self._last_seen:
+            return
+
+        self._is_present = True
+        self._last_seen = last_seen
         self.async_write_ha_state()
 
 
@@ -202,10 +207,15 @@ class BLEZonePresenceSensor(BinarySensorEntity):
         self._last_seen = None
         self._attr_device_class = BinarySensorDeviceClass.PRESENCE
         
-        # Register for updates
-        entity_id = f"beacon_{self._beacon_id.lower().replace(':', '_')}"
-        manager.register_update_callback(entity_id, self._async_update)
-        
+        # Updates are published under the beacon's tracker id
+        self._update_id = f"beacon_{self._beacon_id.lower().replace(':', '_')}"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to state updates once the entity is added."""
+        self.async_on_remove(
+            self._manager.register_update_callback(self._update_id, self._async_update)
+        )
+
     @property
     def name(self) -> str:
         """Return the name of the binary sensor."""
@@ -243,12 +253,15 @@ class BLEZonePresenceSensor(BinarySensorEntity):
     @callback
     def _async_update(self, data: Dict[str, Any]) -> None:
         """Update the binary sensor state."""
-        self._last_seen = data.get(ATTR_LAST_SEEN)
-        
+        last_seen = data.get(ATTR_LAST_SEEN)
+
         # Check if the beacon is in this zone
-        current_zone = data.get(ATTR_ZONE)
-        self._is_in_zone = current_zone == self._zone_id
-            
+        is_in_zone = data.get(ATTR_ZONE) == self._zone_id
+        if is_in_zone == self._is_in_zone and last_seen == self._last_seen:
+            return
+
+        self._is_in_zone = is_in_zone
+        self._last_seen = last_seen
         self.async_write_ha_state()
 
 
@@ -274,10 +287,6 @@ class BLEProxyConnectivitySensor(BinarySensorEntity):
         self._last_seen = None
         self._attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
         
-        # We need a reference to the last_seen timestamp for this proxy
-        # from the manager's _proxy_last_seen dict
-        self._proxy_last_seen = manager._proxy_last_seen
-        
         # Set a large max age threshold for connectivity (twice the regular threshold)
         self._max_age = manager.max_reading_age * 2
         
@@ -294,13 +303,11 @@ class BLEProxyConnectivitySensor(BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return true if the proxy is connected."""
-        # Calculate from last_seen timestamp
-        if self._proxy_id in self._proxy_last_seen:
-            last_seen = self._proxy_last_seen[self._proxy_id]
-            if last_seen is not None:
-                # Check if the proxy has been seen within the max age
-                now = dt_util.utcnow().timestamp()
-                self._is_connected = (now - last_seen) <= self._max_age
+        # Calculate from the time since the proxy was last seen
+        age = self._manager.get_proxy_last_seen_age(self._proxy_id)
+        if age is not None:
+            # Check if the proxy has been seen within the max age
+            self._is_connected = age <= self._max_age
                 
         return self._is_connected
 
@@ -320,11 +327,10 @@ class BLEProxyConnectivitySensor(BinarySensorEntity):
         attrs = {"proxy_id": self._proxy_id}
         
         # Add last_seen if available
-        if self._proxy_id in self._proxy_last_seen:
-            last_seen = self._proxy_last_seen[self._proxy_id]
-            if last_seen is not None:
-                # Convert to ISO format datetime string
-                attrs[ATTR_LAST_SEEN] = dt_util.utc_from_timestamp(last_seen).isoformat()
+        age = self._manager.get_proxy_last_seen_age(self._proxy_id)
+        if age is not None:
+            # Convert to ISO format datetime string
+            attrs[ATTR_LAST_SEEN] = (dt_util.utcnow() - timedelta(seconds=age)).isoformat()
                 
         # Add proxy location if available
         proxy_info = self._manager.proxies.get(self._proxy_id, {})
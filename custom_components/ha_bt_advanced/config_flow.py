@@ -24,6 +24,7 @@ from .const import (
     DEFAULT_POSITION_SMOOTHING,
     DEFAULT_TX_POWER,
     DEFAULT_PATH_LOSS_EXPONENT,
+    DEFAULT_BEACON_SEEN_EVENTS,
     CONF_MQTT_TOPIC,
     CONF_SIGNAL_PARAMETERS,
     CONF_TX_POWER,
@@ -32,6 +33,7 @@ from .const import (
     CONF_POSITION_SMOOTHING,
     CONF_MAX_READING_AGE,
     CONF_MIN_PROXIES,
+    CONF_BEACON_SEEN_EVENTS,
     CONF_BEACONS,
     CONF_PROXIES,
     CONF_BEACON_CATEGORY,
@@ -312,6 +314,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             # Update the config entry
             new_data = {**entry.data}
             new_data[CONF_SIGNAL_PARAMETERS] = new_signal_params
+            new_data[CONF_BEACON_SEEN_EVENTS] = user_input.get(
+                CONF_BEACON_SEEN_EVENTS, DEFAULT_BEACON_SEEN_EVENTS
+            )
 
             self.hass.config_entries.async_update_entry(
                 entry,
@@ -329,6 +334,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 manager.position_smoothing = new_signal_params[CONF_POSITION_SMOOTHING]
                 manager.max_reading_age = new_signal_params[CONF_MAX_READING_AGE]
                 manager.min_proxies = new_signal_params[CONF_MIN_PROXIES]
+                manager.fire_seen_events = new_data[CONF_BEACON_SEEN_EVENTS]
 
             return await self.async_step_menu()
 
@@ -359,6 +365,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_MIN_PROXIES,
                     default=signal_params.get(CONF_MIN_PROXIES, DEFAULT_MIN_PROXIES)
                 ): vol.All(int, vol.Range(min=1, max=10)),
+                vol.Required(
+                    CONF_BEACON_SEEN_EVENTS,
+                    default=entry.data.get(CONF_BEACON_SEEN_EVENTS, DEFAULT_BEACON_SEEN_EVENTS)
+                ): bool,
             }),
             description_placeholders={
                 "info": (
@@ -368,7 +378,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     "• **RSSI Smoothing**: Filter factor for signal strength (0=no smoothing, 1=maximum)\n"
                     "• **Position Smoothing**: Filter factor for position (0=no smoothing, 1=maximum)\n"
                     "• **Max Reading Age**: Discard readings older than this (seconds)\n"
-                    "• **Min Proxies**: Minimum proxies needed for triangulation"
+                    "• **Min Proxies**: Minimum proxies needed for triangulation\n"
+                    "• **Per-reading events**: Also fire ha_bt_advanced_beacon_seen for every "
+                    "reading; turn off if only ha_bt_advanced_beacon_seen_batch is used"
                 )
             }
         )
@@ -511,7 +523,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 if manager:
                     success = await manager.start_discovery(60)
                     if success:
-                        self._discovery_start_time = time.time()
+                        self._discovery_start_time = time.monotonic()
                         return await self.async_step_discovery_progress()
                     else:
                         errors["base"] = "discovery_failed"
@@ -546,7 +558,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 return await self.async_step_discovered_beacons()
 
         # Calculate remaining time
-        elapsed = time.time() - getattr(self, '_discovery_start_time', time.time())
+        elapsed = time.monotonic() - getattr(self, '_discovery_start_time', time.monotonic())
         remaining = max(0, 60 - int(elapsed))
 
         # Get current discovered beacon info
@@ -17,6 +17,7 @@ CONF_SERVICE_ENABLED = "service_enabled"
 CONF_MQTT_TOPIC = "mqtt_topic"
 CONF_SIGNAL_PARAMETERS = "signal_parameters"
 CONF_ENVIRONMENT_PRESET = "environment_preset"
+CONF_BEACON_SEEN_EVENTS = "beacon_seen_events"
 CONF_BEACON_CATEGORY = "category"
 CONF_BEACON_ICON = "icon"
 CONF_ZONE_ID = "zone_id"
@@ -46,6 +47,7 @@ DEFAULT_MAX_READING_AGE = 30
 DEFAULT_MIN_PROXIES = 2
 DEFAULT_MQTT_TOPIC_PREFIX = "ble-triangulation"
 DEFAULT_MQTT_STATE_PREFIX = "ble-location"
+DEFAULT_BEACON_SEEN_EVENTS = True
 DEFAULT_BEACON_ICON = "mdi:bluetooth"
 DEFAULT_PERSON_ICON = "mdi:account"
 DEFAULT_ITEM_ICON = "mdi:package-variant-closed"
@@ -111,5 +113,9 @@ NOTIFICATION_PROXY_OFFLINE = "proxy_offline_{}"
 # Event types
 EVENT_BEACON_DISCOVERED = f"{DOMAIN}_beacon_discovered"
 EVENT_BEACON_SEEN = f"{DOMAIN}_beacon_seen"
+EVENT_BEACON_SEEN_BATCH = f"{DOMAIN}_beacon_seen_batch"
 EVENT_BEACON_ZONE_CHANGE = f"{DOMAIN}_zone_change"
-EVENT_PROXY_STATUS_CHANGE = f"{DOMAIN}_proxy_status_change"
\ No newline at end of file
+EVENT_PROXY_STATUS_CHANGE = f"{DOMAIN}_proxy_status_change"
+
+# Dispatcher signals
+SIGNAL_ENTITY_UPDATE = f"{DOMAIN}_entity_update_{{}}"
\ No newline at end of file
@@ -72,10 +72,13 @@ class BLEBeaconTracker(TrackerEntity):
         self._longitude = None
         self._accuracy = None
         self._last_seen = None
-        self._source_proxies = []
-        
-        # Register for updates
-        manager.register_update_callback(self._unique_id, self._async_update)
+        self._source_proxies = ()
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to state updates once the entity is added."""
+        self.async_on_remove(
+            self._manager.register_update_callback(self._unique_id, self._async_update)
+        )
 
     @property
     def name(self) -> str:
@@ -132,7 +135,7 @@ class BLEBeaconTracker(TrackerEntity):
         self._longitude = data.get(ATTR_LONGITUDE)
         self._accuracy = data.get(ATTR_GPS_ACCURACY)
         self._last_seen = data.get(ATTR_LAST_SEEN)
-        self._source_proxies = data.get(ATTR_SOURCE_PROXIES, [])
+        self._source_proxies = data.get(ATTR_SOURCE_PROXIES, ())
         
         # Update the entity state
         self.async_write_ha_state()
\ No newline at end of file
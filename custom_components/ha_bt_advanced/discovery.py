@@ -41,7 +41,7 @@ class DiscoveryManager:
         """Initialize the discovery manager."""
         self.hass = hass
         self.discovery_mode = False
-        self.discovery_end_time = None
+        self.discovery_end_time = None  # time.monotonic() deadline
         self.discovered_beacons: Dict[str, Dict[str, Any]] = {}
         self.onboarded_beacons: Set[str] = set()
         self.beacon_filters = {
@@ -56,7 +56,7 @@ class DiscoveryManager:
     async def start_discovery(self, duration: int = 60) -> bool:
         """Start discovery mode with proximity filter."""
         self.discovery_mode = True
-        self.discovery_end_time = time.time() + duration
+        self.discovery_end_time = time.monotonic() + duration
         self.discovered_beacons.clear()
         _LOGGER.info(f"Discovery mode started for {duration} seconds")
 
@@ -133,25 +133,28 @@ class DiscoveryManager:
 
         # Always process onboarded beacons
         if self.is_beacon_onboarded(mac):
-            _LOGGER.debug(f"Beacon {mac_upper} is onboarded, will process normally")
+            _LOGGER.debug("Beacon %s is onboarded, will process normally", mac_upper)
             return True
 
         # In discovery mode, apply filters
         if not self.discovery_mode:
-            _LOGGER.debug(f"Beacon {mac_upper} not onboarded and not in discovery mode, ignoring")
+            _LOGGER.debug("Beacon %s not onboarded and not in discovery mode, ignoring", mac_upper)
             return False
 
-        _LOGGER.debug(f"In discovery mode, checking filters for {mac_upper}")
+        _LOGGER.debug("In discovery mode, checking filters for %s", mac_upper)
 
         # Check if discovery has expired
-        if self.discovery_end_time and time.time() > self.discovery_end_time:
+        if self.discovery_end_time and time.monotonic() > self.discovery_end_time:
             self._stop_discovery()
             return False
 
         # Apply proximity filter (more negative = weaker signal)
         # We want to KEEP beacons with RSSI greater than threshold (closer)
         if rssi < self.beacon_filters['min_rssi']:
-            _LOGGER.debug(f"Beacon {mac_upper} filtered out: RSSI {rssi} is weaker than threshold {self.beacon_filters['min_rssi']}")
+            _LOGGER.debug(
+                "Beacon %s filtered out: RSSI %s is weaker than threshold %s",
+                mac_upper, rssi, self.beacon_filters['min_rssi'],
+            )
             return False
 
         # Apply UUID filters
@@ -167,13 +170,13 @@ class DiscoveryManager:
     def process_discovery_beacon(self, mac: str, rssi: int, beacon_data: Dict[str, Any], proxy_id: str) -> None:
         """Process a beacon in discovery mode."""
         if not self.discovery_mode:
-            _LOGGER.debug(f"Not in discovery mode, ignoring beacon {mac}")
+            _LOGGER.debug("Not in discovery mode, ignoring beacon %s", mac)
             return
 
         mac_upper = mac.upper()
         current_time = time.time()
 
-        _LOGGER.info(f"Processing discovery beacon: {mac_upper}, RSSI: {rssi}, Proxy: {proxy_id}")
+        _LOGGER.debug("Processing discovery beacon: %s, RSSI: %s, Proxy: %s", mac_upper, rssi, proxy_id)
 
         if mac_upper not in self.discovered_beacons:
             self.discovered_beacons[mac_upper] = {
@@ -192,9 +195,9 @@ class DiscoveryManager:
         beacon_info['rssi_values'].append(rssi)
         beacon_info['proxies'].add(proxy_id)
 
-        _LOGGER.info(
-            f"Discovery beacon {mac_upper}: count={beacon_info['count']}, "
-            f"RSSI={rssi}, proxies={len(beacon_info['proxies'])}"
+        _LOGGER.debug(
+            "Discovery beacon %s: count=%d, RSSI=%s, proxies=%d",
+            mac_upper, beacon_info['count'], rssi, len(beacon_info['proxies']),
         )
 
         # Keep only last 10 RSSI values for averaging
@@ -2,18 +2,23 @@
 import asyncio
 import json
 import logging
+import math
 import os
+import re
 import subprocess
 import sys
 import time
 from datetime import datetime, timedelta, timezone
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import yaml
 from homeassistant.components import mqtt
-from homeassistant.components.persistent_notification import async_create as async_create_notification
+from homeassistant.components.persistent_notification import (
+    async_create as async_create_notification,
+    async_dismiss as async_dismiss_notification,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_NAME,
@@ -22,11 +27,17 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import template
-from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.util import slugify
+from homeassistant.util.json import json_loads
 import homeassistant.util.dt as dt_util
 
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeDumper, SafeLoader
+
 from .const import (
     DOMAIN,
     CONF_BEACONS,
@@ -42,9 +53,11 @@ from .const import (
     CONF_SERVICE_ENABLED,
     CONF_MQTT_TOPIC,
     CONF_SIGNAL_PARAMETERS,
+    CONF_BEACON_SEEN_EVENTS,
     CONF_BEACON_CATEGORY,
     CONF_BEACON_ICON,
     DEFAULT_MQTT_TOPIC_PREFIX,
+    DEFAULT_BEACON_SEEN_EVENTS,
     DEFAULT_MQTT_STATE_PREFIX,
     BEACON_CATEGORY_PERSON,
     BEACON_CATEGORY_ITEM,
@@ -69,8 +82,10 @@ from .const import (
     ATTR_ICON,
     EVENT_BEACON_DISCOVERED,
     EVENT_BEACON_SEEN,
+    EVENT_BEACON_SEEN_BATCH,
     EVENT_BEACON_ZONE_CHANGE,
     EVENT_PROXY_STATUS_CHANGE,
+    SIGNAL_ENTITY_UPDATE,
     NOTIFICATION_NEW_BEACON,
     NOTIFICATION_BEACON_MISSING,
     NOTIFICATION_PROXY_OFFLINE,
@@ -81,6 +96,148 @@ from .discovery import DiscoveryManager
 
 _LOGGER = logging.getLogger(__name__)
 
+# MAC address normalization
+_MAC_STRIP = str.maketrans("", "", ":-")
+_MAC_RE = re.compile(r"^[0-9A-F]{12}$")
+
+# Minimum interval (seconds) between last-seen timestamp writes for a beacon
+LAST_SEEN_WRITE_INTERVAL = 1.0
+
+# Delay (seconds) over which beacon/proxy changes are batched into one config entry update
+CONFIG_ENTRY_UPDATE_DELAY = 1.0
+
+# Zone lookups are cached per ~5 m grid cell (1/20000 degree)
+ZONE_CACHE_BINS_PER_DEGREE = 20000
+
+# Interval (seconds) over which beacon seen events and entity updates are batched;
+# beacons advertise at 1-10 Hz per proxy, so this keeps about four writes per second
+UPDATE_FLUSH_INTERVAL = 0.25
+
+# Proxy status message fields kept as proxy metadata, with their defaults
+PROXY_METADATA_FIELDS = (
+    ('status', 'online'),
+    ('ip_address', None),
+    ('mac_address', None),
+    ('wifi_ssid', None),
+    ('wifi_rssi', None),
+    ('hardware', 'ESP32'),
+    ('board', None),
+    ('esphome_version', None),
+    ('temperature', None),
+    ('free_heap', None),
+    ('uptime', None),
+    ('cpu_frequency', None),
+    ('flash_size', None),
+    ('timestamp', None),
+)
+
+# Proxy metadata fields included in the proxy back-online event
+PROXY_STATUS_EVENT_FIELDS = ('status', 'ip_address', 'wifi_ssid', 'wifi_rssi', 'temperature', 'uptime')
+
+# Advertisement fields kept for discovered beacons (iBeacon, Eddystone, telemetry)
+BEACON_DATA_KEYS = (
+    'uuid', 'major', 'minor', 'tx_power', 'manufacturer_id',
+    'eddystone_uid', 'eddystone_url', 'eddystone_namespace', 'eddystone_instance',
+    'battery_voltage', 'temperature', 'packet_count', 'uptime_seconds',
+    'battery_level', 'frame_type', 'service_uuids',
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_mac(mac_address: str) -> Optional[str]:
+    """Return the MAC formatted as AA:BB:CC:DD:EE:FF, or None if invalid."""
+    mac = mac_address.upper().translate(_MAC_STRIP)
+    if not _MAC_RE.match(mac):
+        return None
+    return ":".join([mac[i:i+2] for i in range(0, 12, 2)])
+
+
+def _monotonic_to_timestamp(seen_time: Optional[float]) -> Optional[float]:
+    """Convert a time.monotonic() last-seen value to a UNIX timestamp (None if never seen)."""
+    if not seen_time:
+        return None
+    return time.time() - (time.monotonic() - seen_time)
+
+
+def _position_snapshot(
+    lat: Optional[float],
+    lng: Optional[float],
+    acc: Optional[float],
+    zone: Optional[str],
+    last_seen: str,
+) -> Tuple[Any, ...]:
+    """Return the snapshot of an entity update used to skip unchanged updates.
+
+    Position is rounded to ~1m and accuracy to 0.1m, so jitter below what the
+    entities show does not count as a change. The last-seen second is part of
+    the snapshot, so a beacon that keeps being seen still updates once per second.
+    """
+    return (
+        round(lat, 5) if lat is not None else None,
+        round(lng, 5) if lng is not None else None,
+        round(acc, 1) if acc is not None else None,
+        zone,
+        last_seen,
+    )
+
+
+def _decode_json_object(raw_payload: Any) -> Optional[Dict[str, Any]]:
+    """Decode an MQTT payload that must be a JSON object, or return None."""
+    try:
+        # orjson-backed, accepts bytes or str
+        payload = json_loads(raw_payload)
+    except json.JSONDecodeError:
+        _LOGGER.error(f"Invalid JSON payload: {raw_payload}")
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _extract_beacon_data(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the beacon advertisement fields present in an MQTT payload.
+
+    Only fields with a value are kept, so merging a later advertisement (e.g. a
+    TLM frame without iBeacon data) does not clear fields seen earlier.
+    """
+    return {key: payload[key] for key in BEACON_DATA_KEYS if payload.get(key) is not None}
+
+
+def _load_config_dir(config_dir: Path) -> List[Tuple[str, Any]]:
+    """Read and parse all YAML files in a config directory (runs in executor)."""
+    if not config_dir.exists():
+        config_dir.mkdir(parents=True, exist_ok=True)
+        return []
+
+    results = []
+    for file_path in config_dir.glob("*.yaml"):
+        try:
+            results.append((file_path.stem, yaml.load(file_path.read_text(), Loader=SafeLoader)))
+        except Exception as e:
+            _LOGGER.error(f"Error loading config from {file_path}: {e}")
+
+    return results
+
+
+def _dump_yaml(data: Dict[str, Any]) -> str:
+    """Serialize a config dict to YAML using the C dumper when available."""
+    return yaml.dump(data, Dumper=SafeDumper)
+
+
+def _write_config_files(files: List[Tuple[Path, Dict[str, Any]]]) -> None:
+    """Serialize and atomically write config files (runs in executor)."""
+    for file_path, data in files:
+        content = _dump_yaml(data)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so a crash never leaves a truncated config
+        tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+        tmp_path.write_text(content)
+        os.replace(tmp_path, file_path)
+
+
+def _remove_config_file(file_path: Path) -> None:
+    """Remove a config file if it exists (runs in executor)."""
+    file_path.unlink(missing_ok=True)
+
+
 class TriangulationManager:
     """Manage BLE Triangulation service."""
 
@@ -98,18 +255,31 @@ class TriangulationManager:
         self.position_smoothing = signal_params.get(CONF_POSITION_SMOOTHING, 0.2)
         self.max_reading_age = signal_params.get(CONF_MAX_READING_AGE, 30)
         self.min_proxies = signal_params.get(CONF_MIN_PROXIES, 2)
+
+        # Keep firing the per-reading beacon seen event next to the batch event,
+        # so existing automations keep working unless it is switched off
+        self.fire_seen_events = self.config.get(CONF_BEACON_SEEN_EVENTS, DEFAULT_BEACON_SEEN_EVENTS)
         
         # MQTT topics
         self.mqtt_topic_prefix = self.config.get(CONF_MQTT_TOPIC, DEFAULT_MQTT_TOPIC_PREFIX)
         self.mqtt_state_prefix = DEFAULT_MQTT_STATE_PREFIX
+        # Topic layout:
+        #   <prefix>/proxy/<proxy_id>/status -> proxy status
+        #   <prefix>/<proxy_id>              -> beacon advertisement
+        self._beacon_topic_prefix = f"{self.mqtt_topic_prefix}/"
+        self._status_topic_prefix = f"{self.mqtt_topic_prefix}/proxy/"
+        self._status_topic_suffix = "/status"
         
         # Callback registries
-        self._beacon_callbacks = set()
-        self._update_callbacks = {}
+        self._beacon_callbacks: Tuple[Callable[[str, str], None], ...] = ()  # Rebuilt on (rare) registration
+        self._last_published = {}  # entity_id -> _position_snapshot() last sent to callbacks
+        self._payload_pool = {}  # entity_id -> state dict reused for every update of the entity
+        self._update_subscribers = {}  # entity_id -> number of connected update callbacks
         
         # Beacon and proxy tracking (will be loaded async in start())
         self.beacons = {}
         self.proxies = {}
+        self._proxy_positions = {}  # proxy_id -> {latitude, longitude}, rebuilt when proxies change
         
         # Initialize zone manager
         self.zone_manager = ZoneManager(hass)
@@ -122,21 +292,36 @@ class TriangulationManager:
 
         # Initialize beacon trackers
         self._trackers = {}
+        self._dirty_trackers = set()  # MACs of trackers that received readings since the last cleanup
         self._initialize_trackers()
         
         # MQTT subscription
-        self._mqtt_subscription = None
+        self._mqtt_subscriptions = []
         
         # Proxy and beacon status tracking
         self._proxy_last_seen = {}
         self._beacon_last_seen = {}
-        self._proxy_offline_notifications = {}
+        self._proxy_offline_notifications = {}  # proxy_id -> notification_id
         self._proxy_metadata = {}  # Store proxy metadata from status messages
+        self._pending_proxy_adds = set()  # Auto-detected proxies being registered
+
+        # Config entry changes waiting for the debounced flush: section -> {key: value or None}
+        self._pending_entry_updates = {}
+        self._entry_update_unsub = None
+
+        # (whole second, ISO string) cache for last-seen timestamps
+        self._iso_cache = (0, "")
+
+        # Beacon seen events waiting to be fired as one batch
+        self._pending_seen_events = []
+        # Latest entity state per entity_id waiting for the batched flush
+        self._pending_entity_updates: Dict[str, Dict[str, Any]] = {}
+        self._flush_handle = None
 
         # Calibration data
         self._calibration_mode = {}  # proxy_id -> {start_time, reference_distance, duration, rssi_samples}
         self._calibration_results = {}  # proxy_id -> {tx_power, path_loss_exponent, avg_rssi, std_dev}
-        self._beacon_missing_notifications = {}
+        self._beacon_missing_notifications = {}  # mac -> notification_id
         
         # Schedule periodic cleanup and status check
         self._cleanup_interval = async_track_time_interval(
@@ -149,50 +334,45 @@ class TriangulationManager:
     def _initialize_trackers(self) -> None:
         """Initialize beacon trackers from configurations."""
         for mac, beacon_info in self.beacons.items():
-            name = beacon_info.get(CONF_NAME, f"Beacon {mac}")
-            category = beacon_info.get(CONF_BEACON_CATEGORY, BEACON_CATEGORY_ITEM)
-            icon = beacon_info.get(CONF_BEACON_ICON, CATEGORY_ICONS.get(category))
-            
-            # Use beacon-specific signal parameters if available
-            tx_power = beacon_info.get(CONF_TX_POWER, self.tx_power)
-            path_loss_exponent = beacon_info.get(CONF_PATH_LOSS_EXPONENT, self.path_loss_exponent)
-            
-            self._trackers[mac] = BeaconTracker(
-                mac=mac,
-                name=name,
-                tx_power=tx_power,
-                path_loss_exponent=path_loss_exponent,
-                rssi_smoothing=self.rssi_smoothing,
-                position_smoothing=self.position_smoothing,
-                max_reading_age=self.max_reading_age,
-                icon=icon,
-                category=category,
-            )
+            if mac not in self._trackers:
+                self._trackers[mac] = self._create_tracker(mac, beacon_info)
+
+    def _create_tracker(self, mac: str, beacon_info: Dict[str, Any]) -> BeaconTracker:
+        """Create a tracker with the settings resolved once from a beacon config."""
+        name = beacon_info.get(CONF_NAME, f"Beacon {mac}")
+        category = beacon_info.get(CONF_BEACON_CATEGORY, BEACON_CATEGORY_ITEM)
+        icon = beacon_info.get(CONF_BEACON_ICON, CATEGORY_ICONS.get(category))
+
+        # Use beacon-specific signal parameters if available
+        tx_power = beacon_info.get(CONF_TX_POWER, self.tx_power)
+        path_loss_exponent = beacon_info.get(CONF_PATH_LOSS_EXPONENT, self.path_loss_exponent)
+
+        return BeaconTracker(
+            mac=mac,
+            name=name,
+            tx_power=tx_power,
+            path_loss_exponent=path_loss_exponent,
+            rssi_smoothing=self.rssi_smoothing,
+            position_smoothing=self.position_smoothing,
+            max_reading_age=self.max_reading_age,
+            icon=icon,
+            category=category,
+        )
 
     async def _async_load_beacons(self) -> Dict[str, Dict[str, Any]]:
         """Load beacon configuration from files asynchronously."""
         beacons = {}
         beacon_dir = Path(self.hass.config.path(BEACON_CONFIG_DIR))
 
-        if not beacon_dir.exists():
-            await self.hass.async_add_executor_job(lambda: beacon_dir.mkdir(parents=True, exist_ok=True))
-            return beacons
-
-        file_paths = await self.hass.async_add_executor_job(
-            lambda: list(beacon_dir.glob("*.yaml"))
-        )
-
-        for file_path in file_paths:
-            try:
-                content = await self.hass.async_add_executor_job(file_path.read_text)
-                beacon_config = yaml.safe_load(content)
-                if beacon_config and isinstance(beacon_config, dict):
-                    mac = file_path.stem.upper()
-                    beacons[mac] = beacon_config
-                    # Add to onboarded list in discovery manager
-                    self.discovery_manager.add_onboarded_beacon(mac)
-            except Exception as e:
-                _LOGGER.error(f"Error loading beacon config from {file_path}: {e}")
+        # Read and parse all files in a single executor job
+        for stem, beacon_config in await self.hass.async_add_executor_job(
+            _load_config_dir, beacon_dir
+        ):
+            if beacon_config and isinstance(beacon_config, dict):
+                mac = stem.upper()
+                beacons[mac] = beacon_config
+                # Add to onboarded list in discovery manager
+                self.discovery_manager.add_onboarded_beacon(mac)
 
         return beacons
 
@@ -201,49 +381,94 @@ class TriangulationManager:
         proxies = {}
         proxy_dir = Path(self.hass.config.path(PROXY_CONFIG_DIR))
 
-        if not proxy_dir.exists():
-            await self.hass.async_add_executor_job(lambda: proxy_dir.mkdir(parents=True, exist_ok=True))
-            return proxies
-
-        file_paths = await self.hass.async_add_executor_job(
-            lambda: list(proxy_dir.glob("*.yaml"))
-        )
-
-        for file_path in file_paths:
-            try:
-                content = await self.hass.async_add_executor_job(file_path.read_text)
-                proxy_config = yaml.safe_load(content)
-                if proxy_config and isinstance(proxy_config, dict):
-                    proxy_id = file_path.stem
-                    proxies[proxy_id] = proxy_config
-            except Exception as e:
-                _LOGGER.error(f"Error loading proxy config from {file_path}: {e}")
+        # Read and parse all files in a single executor job
+        for proxy_id, proxy_config in await self.hass.async_add_executor_job(
+            _load_config_dir, proxy_dir
+        ):
+            if proxy_config and isinstance(proxy_config, dict):
+                proxies[proxy_id] = proxy_config
 
         return proxies
 
+    async def _async_write_config_files(self, files: List[Tuple[Path, Dict[str, Any]]]) -> None:
+        """Serialize and write one or more config files in a single executor job."""
+        if files:
+            await self.hass.async_add_executor_job(_write_config_files, files)
+
+    def _rebuild_proxy_positions(self) -> None:
+        """Rebuild the cached proxy positions used for triangulation.
+
+        Positions are stored as (lat, lng) tuples and proxies without
+        coordinates are left out, so the per-message lookup needs no checks.
+        """
+        self._proxy_positions = {
+            p_id: (info[CONF_LATITUDE], info[CONF_LONGITUDE])
+            for p_id, info in self.proxies.items()
+            if info.get(CONF_LATITUDE) is not None and info.get(CONF_LONGITUDE) is not None
+        }
+
     def register_beacon_callback(self, callback_func: Callable[[str, str], None]) -> None:
         """Register callback for beacon discovery."""
-        self._beacon_callbacks.add(callback_func)
+        if callback_func not in self._beacon_callbacks:
+            self._beacon_callbacks += (callback_func,)
         
         # Call callback for existing beacons
         for beacon_id, beacon_info in self.beacons.items():
             name = beacon_info.get(CONF_NAME, f"Beacon {beacon_id}")
             callback_func(beacon_id, name)
 
-    def register_update_callback(self, entity_id: str, callback_func: Callable[[Dict[str, Any]], None]) -> None:
-        """Register callback for entity state updates."""
-        self._update_callbacks[entity_id] = callback_func
+    @callback
+    def register_update_callback(
+        self, entity_id: str, callback_func: Callable[[Dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        """Connect a callback to an entity's state updates and return the disconnect function.
+
+        Several entities of one beacon (tracker, sensors, zone binary sensors)
+        subscribe to the same id, each through its own dispatcher connection.
+
+        All subscribers receive the same pooled state dict, which the manager
+        keeps filling in place with later readings. Callbacks must copy the
+        values they need and must not keep a reference to the dict.
+        """
+        disconnect = async_dispatcher_connect(
+            self.hass, SIGNAL_ENTITY_UPDATE.format(entity_id), callback_func
+        )
+        self._update_subscribers[entity_id] = self._update_subscribers.get(entity_id, 0) + 1
+
+        @callback
+        def _unsubscribe() -> None:
+            """Disconnect the callback and drop the entity's pooled state with the last one."""
+            disconnect()
+            remaining = self._update_subscribers.pop(entity_id, 1) - 1
+            if remaining > 0:
+                self._update_subscribers[entity_id] = remaining
+            else:
+                self._payload_pool.pop(entity_id, None)
+                # A re-added entity must get the next update even if unchanged
+                self._last_published.pop(entity_id, None)
+
+        return _unsubscribe
+
+    def _entity_payload(self, entity_id: str) -> Dict[str, Any]:
+        """Return the pooled state dict of an entity, creating it on first use."""
+        payload = self._payload_pool.get(entity_id)
+        if payload is None:
+            payload = self._payload_pool[entity_id] = {}
+        return payload
+
+    @callback
+    def _send_entity_update(self, entity_id: str, state: Dict[str, Any]) -> None:
+        """Send an entity's new state to every connected callback."""
+        async_dispatcher_send(self.hass, SIGNAL_ENTITY_UPDATE.format(entity_id), state)
 
     def _validate_mac_address(self, mac_address: str) -> bool:
         """Validate MAC address format."""
-        mac = mac_address.upper().replace(":", "").replace("-", "")
         # Check if it's a valid MAC address (12 hex digits)
-        return len(mac) == 12 and all(c in "0123456789ABCDEF" for c in mac)
+        return _normalize_mac(mac_address) is not None
 
     def _format_mac_address(self, mac_address: str) -> str:
         """Format MAC address consistently (AA:BB:CC:DD:EE:FF)."""
-        mac = mac_address.upper().replace(":", "").replace("-", "")
-        return ":".join([mac[i:i+2] for i in range(0, 12, 2)])
+        return _normalize_mac(mac_address)
 
     async def add_beacon(
         self, 
@@ -297,13 +522,8 @@ class TriangulationManager:
             beacon_config[CONF_PATH_LOSS_EXPONENT] = path_loss_exponent
         
         # Save to file
-        beacon_dir = Path(self.hass.config.path(BEACON_CONFIG_DIR))
-        if not beacon_dir.exists():
-            await self.hass.async_add_executor_job(lambda: beacon_dir.mkdir(parents=True, exist_ok=True))
-        
-        beacon_file = beacon_dir / f"{mac}.yaml"
-        content = yaml.dump(beacon_config)
-        await self.hass.async_add_executor_job(beacon_file.write_text, content)
+        beacon_file = Path(self.hass.config.path(BEACON_CONFIG_DIR)) / f"{mac}.yaml"
+        await self._async_write_config_files([(beacon_file, beacon_config)])
             
         # Add to in-memory config
         self.beacons[mac] = beacon_config
@@ -313,26 +533,10 @@ class TriangulationManager:
 
         # Create tracker if it doesn't exist
         if mac not in self._trackers:
-            # Use beacon-specific signal parameters if provided
-            beacon_tx_power = tx_power if tx_power is not None else self.tx_power
-            beacon_path_loss = path_loss_exponent if path_loss_exponent is not None else self.path_loss_exponent
-            
-            self._trackers[mac] = BeaconTracker(
-                mac=mac,
-                name=name,
-                tx_power=beacon_tx_power,
-                path_loss_exponent=beacon_path_loss,
-                rssi_smoothing=self.rssi_smoothing,
-                position_smoothing=self.position_smoothing,
-                max_reading_age=self.max_reading_age,
-                icon=icon,
-                category=category,
-            )
+            self._trackers[mac] = self._create_tracker(mac, beacon_config)
         
         # Update config entry
-        config = dict(self.config_entry.data)
-        config[CONF_BEACONS] = {**config.get(CONF_BEACONS, {}), mac: beacon_config}
-        self.hass.config_entries.async_update_entry(self.config_entry, data=config)
+        self._schedule_config_entry_update(CONF_BEACONS, mac, beacon_config)
         
         # Notify callbacks
         for callback_func in self._beacon_callbacks:
@@ -349,13 +553,8 @@ class TriangulationManager:
             }
         )
         
-        # Update beacon last seen timestamp
-        self._beacon_last_seen[mac] = time.time()
-        
-        # Clear any missing notifications for this beacon
-        notification_id = NOTIFICATION_BEACON_MISSING.format(mac)
-        if notification_id in self._beacon_missing_notifications:
-            del self._beacon_missing_notifications[notification_id]
+        # Update beacon last seen timestamp and clear any missing notification
+        self._mark_beacon_seen(mac, time.monotonic())
             
         _LOGGER.info(f"Added new beacon: {name} ({mac})")
 
@@ -373,8 +572,7 @@ class TriangulationManager:
         beacon_dir = Path(self.hass.config.path(BEACON_CONFIG_DIR))
         beacon_file = beacon_dir / f"{mac}.yaml"
         
-        if beacon_file.exists():
-            await self.hass.async_add_executor_job(beacon_file.unlink)
+        await self.hass.async_add_executor_job(_remove_config_file, beacon_file)
             
         # Remove from in-memory config
         if mac in self.beacons:
@@ -383,26 +581,24 @@ class TriangulationManager:
         # Remove from onboarded list
         self.discovery_manager.remove_onboarded_beacon(mac)
             
-        # Remove tracker
-        if mac in self._trackers:
-            del self._trackers[mac]
+        # Remove tracker and the state kept for its entity
+        tracker = self._trackers.pop(mac, None)
+        if tracker is not None:
+            self._last_published.pop(tracker.entity_id, None)
+            self._payload_pool.pop(tracker.entity_id, None)
+            self._pending_entity_updates.pop(tracker.entity_id, None)
             
         # Remove from beacon status tracking
         if mac in self._beacon_last_seen:
             del self._beacon_last_seen[mac]
             
         # Clear any missing notifications
-        notification_id = NOTIFICATION_BEACON_MISSING.format(mac)
-        if notification_id in self._beacon_missing_notifications:
-            del self._beacon_missing_notifications[notification_id]
+        notification_id = self._beacon_missing_notifications.pop(mac, None)
+        if notification_id is not None:
+            async_dismiss_notification(self.hass, notification_id)
             
         # Update config entry
-        config = dict(self.config_entry.data)
-        beacons = config.get(CONF_BEACONS, {})
-        if mac in beacons:
-            del beacons[mac]
-            config[CONF_BEACONS] = beacons
-            self.hass.config_entries.async_update_entry(self.config_entry, data=config)
+        self._schedule_config_entry_update(CONF_BEACONS, mac, None)
             
         _LOGGER.info(f"Removed beacon: {mac}")
 
@@ -436,32 +632,20 @@ class TriangulationManager:
         }
         
         # Save to file
-        proxy_dir = Path(self.hass.config.path(PROXY_CONFIG_DIR))
-        if not proxy_dir.exists():
-            await self.hass.async_add_executor_job(lambda: proxy_dir.mkdir(parents=True, exist_ok=True))
-        
-        proxy_file = proxy_dir / f"{proxy_id}.yaml"
-        content = yaml.dump(proxy_config)
-        await self.hass.async_add_executor_job(proxy_file.write_text, content)
+        proxy_file = Path(self.hass.config.path(PROXY_CONFIG_DIR)) / f"{proxy_id}.yaml"
+        await self._async_write_config_files([(proxy_file, proxy_config)])
             
         # Add to in-memory config
         self.proxies[proxy_id] = proxy_config
+        self._rebuild_proxy_positions()
         
         # Update config entry
-        config = dict(self.config_entry.data)
-        config[CONF_PROXIES] = {
-            **config.get(CONF_PROXIES, {}), 
-            proxy_id: {
-                CONF_LATITUDE: lat,
-                CONF_LONGITUDE: lng,
-            }
-        }
-        self.hass.config_entries.async_update_entry(self.config_entry, data=config)
-        
-        # Restart service if running
-        if self._mqtt_subscription is not None:
-            await self.restart_service()
-            
+        self._schedule_config_entry_update(
+            CONF_PROXIES, proxy_id, {CONF_LATITUDE: lat, CONF_LONGITUDE: lng}
+        )
+
+        # No restart needed: the wildcard subscriptions already deliver messages
+        # for any proxy id and the cached positions were rebuilt above
         _LOGGER.info(f"Added new proxy: {proxy_id} at ({lat}, {lng})")
 
     async def remove_proxy(self, proxy_id: str) -> None:
@@ -475,34 +659,25 @@ class TriangulationManager:
         proxy_dir = Path(self.hass.config.path(PROXY_CONFIG_DIR))
         proxy_file = proxy_dir / f"{proxy_id}.yaml"
         
-        if proxy_file.exists():
-            await self.hass.async_add_executor_job(proxy_file.unlink)
+        await self.hass.async_add_executor_job(_remove_config_file, proxy_file)
             
         # Remove from in-memory config
         if proxy_id in self.proxies:
             del self.proxies[proxy_id]
+            self._rebuild_proxy_positions()
             
         # Remove from proxy status tracking
         if proxy_id in self._proxy_last_seen:
             del self._proxy_last_seen[proxy_id]
             
         # Remove any offline notifications
-        notification_id = NOTIFICATION_PROXY_OFFLINE.format(proxy_id)
-        if notification_id in self._proxy_offline_notifications:
-            del self._proxy_offline_notifications[notification_id]
+        notification_id = self._proxy_offline_notifications.pop(proxy_id, None)
+        if notification_id is not None:
+            async_dismiss_notification(self.hass, notification_id)
             
         # Update config entry
-        config = dict(self.config_entry.data)
-        proxies = config.get(CONF_PROXIES, {})
-        if proxy_id in proxies:
-            del proxies[proxy_id]
-            config[CONF_PROXIES] = proxies
-            self.hass.config_entries.async_update_entry(self.config_entry, data=config)
-            
-        # Restart service if running
-        if self._mqtt_subscription is not None:
-            await self.restart_service()
-            
+        self._schedule_config_entry_update(CONF_PROXIES, proxy_id, None)
+
         _LOGGER.info(f"Removed proxy: {proxy_id}")
 
     async def generate_config_yaml(self) -> str:
@@ -528,230 +703,173 @@ class TriangulationManager:
             }
         }
         
-        return yaml.dump(config, default_flow_style=False)
-
-    async def _mqtt_message_received(self, msg) -> None:
-        """Handle received MQTT message."""
-        try:
-            # Parse topic to determine message type
-            topic_parts = msg.topic.split("/")
-            if len(topic_parts) < 2:
-                return
-
-            # Parse payload
-            payload = json.loads(msg.payload)
-            if not isinstance(payload, dict):
-                return
-
-            # Check if this is a proxy status message
-            if "proxy" in topic_parts and "status" in topic_parts:
-                # Handle proxy status message
-                proxy_id = topic_parts[-2]  # proxy_id is before "status"
-                await self._handle_proxy_status(proxy_id, payload)
-                return
+        return await self.hass.async_add_executor_job(
+            partial(yaml.dump, config, Dumper=SafeDumper, default_flow_style=False)
+        )
 
-            # Otherwise it's a beacon message
-            proxy_id = topic_parts[-1]
+    @callback
+    def _mqtt_status_received(self, msg) -> None:
+        """Handle a proxy status message (<prefix>/proxy/<proxy_id>/status)."""
+        proxy_id = msg.topic[len(self._status_topic_prefix):-len(self._status_topic_suffix)]
+        payload = _decode_json_object(msg.payload)
+        if proxy_id and payload is not None:
+            self._handle_proxy_status(proxy_id, payload)
+
+    @callback
+    def _mqtt_beacon_received(self, msg) -> None:
+        """Handle a beacon advertisement message (<prefix>/<proxy_id>)."""
+        proxy_id = msg.topic[len(self._beacon_topic_prefix):]
+        payload = _decode_json_object(msg.payload)
+        if not proxy_id or payload is None:
+            return
 
-            # Update proxy last seen timestamp
-            current_time = time.time()
-            self._proxy_last_seen[proxy_id] = current_time
+        try:
+            self._handle_beacon_message(proxy_id, payload)
+        except Exception as e:
+            _LOGGER.exception(f"Error processing MQTT message: {e}")
 
-            # Auto-detect new proxy if not already known
-            if proxy_id not in self.proxies:
-                _LOGGER.info(f"Auto-detected new proxy: {proxy_id}")
-                # Try to get coordinates from payload or use home coordinates as default
-                latitude = self.hass.config.latitude
-                longitude = self.hass.config.longitude
-
-                # Check if payload contains proxy location
-                if "proxy_location" in payload:
-                    loc = payload["proxy_location"]
-                    if isinstance(loc, dict):
-                        latitude = loc.get("latitude", latitude)
-                        longitude = loc.get("longitude", longitude)
-
-                # Add the proxy automatically
-                await self.add_proxy(proxy_id, latitude, longitude)
+    @callback
+    def _handle_beacon_message(self, proxy_id: str, payload: Dict[str, Any]) -> None:
+        """Handle a beacon advertisement relayed by a proxy."""
+        current_time = time.time()
+        # Last-seen bookkeeping uses the monotonic clock so that wall-clock
+        # jumps (NTP steps) cannot mark devices offline or missing
+        seen_time = time.monotonic()
+
+        # Auto-detect new proxy if not already known
+        if proxy_id not in self.proxies and proxy_id not in self._pending_proxy_adds:
+            _LOGGER.info(f"Auto-detected new proxy: {proxy_id}")
+            # Try to get coordinates from payload or use home coordinates as default
+            latitude = self.hass.config.latitude
+            longitude = self.hass.config.longitude
+
+            # Check if payload contains proxy location
+            if "proxy_location" in payload:
+                loc = payload["proxy_location"]
+                if isinstance(loc, dict):
+                    latitude = loc.get("latitude", latitude)
+                    longitude = loc.get("longitude", longitude)
+
+            # Add the proxy in the background so ingestion is not blocked
+            self._async_add_detected_proxy(proxy_id, latitude, longitude)
+
+        # Update proxy last seen timestamp and mark it back online if needed
+        self._mark_proxy_seen(proxy_id, seen_time)
+            
+        beacon_mac = payload.get(ATTR_BEACON_MAC)
+        rssi = payload.get(ATTR_RSSI)
 
-                # Log that a new proxy was auto-detected
-                _LOGGER.info(f"Added auto-detected proxy {proxy_id} at ({latitude}, {longitude})")
+        if not beacon_mac or rssi is None:
+            return
 
-            # Clear any offline notifications for this proxy
-            notification_id = NOTIFICATION_PROXY_OFFLINE.format(proxy_id)
-            if notification_id in self._proxy_offline_notifications:
-                del self._proxy_offline_notifications[notification_id]
-
-                # Fire event for proxy coming back online
-                self.hass.bus.async_fire(
-                    EVENT_PROXY_STATUS_CHANGE,
-                    {
-                        ATTR_PROXY_ID: proxy_id,
-                        "status": "online",
-                        ATTR_LAST_SEEN: current_time,
-                    }
+        # Check if this proxy is in calibration mode
+        if self.is_proxy_calibrating(proxy_id):
+            calibration_data = self._calibration_mode.get(proxy_id)
+            if calibration_data:
+                # Collect RSSI samples for calibration
+                calibration_data["rssi_samples"].append(rssi)
+                _LOGGER.debug(
+                    "Calibration sample for %s: RSSI=%s dBm (sample #%d)",
+                    proxy_id, rssi, len(calibration_data['rssi_samples']),
                 )
-                
-            beacon_mac = payload.get(ATTR_BEACON_MAC)
-            rssi = payload.get(ATTR_RSSI)
+                # Don't process beacon normally during calibration
+                return
 
-            if not beacon_mac or rssi is None:
+        # Most advertisements come from untracked devices, so drop them before
+        # doing any further work unless discovery mode needs to see them
+        mac = _normalize_mac(beacon_mac)
+        if mac not in self.beacons:
+            if not self.discovery_manager.discovery_mode:
                 return
 
-            # Check if this proxy is in calibration mode
-            if self.is_proxy_calibrating(proxy_id):
-                calibration_data = self._calibration_mode.get(proxy_id)
-                if calibration_data:
-                    # Collect RSSI samples for calibration
-                    calibration_data["rssi_samples"].append(rssi)
-                    _LOGGER.debug(
-                        f"Calibration sample for {proxy_id}: RSSI={rssi} dBm "
-                        f"(sample #{len(calibration_data['rssi_samples'])})"
-                    )
-                    # Don't process beacon normally during calibration
-                    return
-
-            # Extract beacon data including Eddystone telemetry
-            beacon_data = {
-                # iBeacon data
-                'uuid': payload.get('uuid'),
-                'major': payload.get('major'),
-                'minor': payload.get('minor'),
-                'tx_power': payload.get('tx_power'),
-                'manufacturer_id': payload.get('manufacturer_id'),
-                'service_uuids': payload.get('service_uuids', []),
-                # Eddystone data
-                'eddystone_uid': payload.get('eddystone_uid'),
-                'eddystone_url': payload.get('eddystone_url'),
-                'eddystone_namespace': payload.get('eddystone_namespace'),
-                'eddystone_instance': payload.get('eddystone_instance'),
-                # Eddystone telemetry (TLM frame)
-                'battery_voltage': payload.get('battery_voltage'),
-                'temperature': payload.get('temperature'),
-                'packet_count': payload.get('packet_count'),
-                'uptime_seconds': payload.get('uptime_seconds'),
-                # Generic telemetry
-                'battery_level': payload.get('battery_level'),
-                'frame_type': payload.get('frame_type'),
-            }
+            # The payload is passed as-is since the filters only read it through .get()
+            if self.discovery_manager.should_process_beacon(beacon_mac, rssi, payload):
+                self.discovery_manager.process_discovery_beacon(
+                    beacon_mac, rssi, _extract_beacon_data(payload), proxy_id
+                )
+            return
 
-            # Check if beacon should be processed
-            should_process = self.discovery_manager.should_process_beacon(beacon_mac, rssi, beacon_data)
+        # Parse timestamp or use current time
+        ts_str = payload.get(ATTR_TIMESTAMP)
+        if ts_str:
+            try:
+                # ciso8601-backed parser from HA core, handles the "Z" suffix
+                timestamp = dt_util.as_timestamp(ts_str)
+            except ValueError:
+                timestamp = current_time
+        else:
+            timestamp = current_time
 
-            # If in discovery mode and beacon passes filters, add to discovered beacons
-            if self.discovery_manager.discovery_mode and should_process:
-                self.discovery_manager.process_discovery_beacon(beacon_mac, rssi, beacon_data, proxy_id)
+        # Update beacon last seen timestamp and clear any missing notification
+        self._mark_beacon_seen(mac, seen_time)
 
-            # If beacon should not be processed normally (not onboarded), return
-            if not should_process:
-                return
+        # Update beacon tracker
+        tracker = self._trackers.get(mac)
+        if tracker is None:
+            # Should not happen with the code above, but just in case
+            tracker = self._trackers[mac] = self._create_tracker(mac, self.beacons[mac])
 
-            # Parse timestamp or use current time
-            ts_str = payload.get(ATTR_TIMESTAMP)
-            if ts_str:
-                try:
-                    dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                    timestamp = dt.timestamp()
-                except ValueError:
-                    timestamp = current_time
-            else:
-                timestamp = current_time
-                
-            # Format MAC address consistently
-            if not self._validate_mac_address(beacon_mac):
-                _LOGGER.warning(f"Invalid MAC address received: {beacon_mac}")
-                return
-                
-            mac = self._format_mac_address(beacon_mac)
-            
-            # Update beacon last seen timestamp
-            self._beacon_last_seen[mac] = current_time
-            
-            # Clear any missing notifications for this beacon
-            notification_id = NOTIFICATION_BEACON_MISSING.format(mac)
-            if notification_id in self._beacon_missing_notifications:
-                del self._beacon_missing_notifications[notification_id]
-            
-            # Only process onboarded beacons
-            if mac not in self.beacons:
-                _LOGGER.debug(f"Ignoring non-onboarded beacon: {mac}")
-                return
-                
-            # Update beacon tracker
-            if mac not in self._trackers:
-                # Should not happen with the code above, but just in case
-                beacon_info = self.beacons.get(mac, {})
-                name = beacon_info.get(CONF_NAME, f"Beacon {mac}")
-                category = beacon_info.get(CONF_BEACON_CATEGORY, BEACON_CATEGORY_ITEM)
-                icon = beacon_info.get(CONF_BEACON_ICON, CATEGORY_ICONS.get(category))
-                tx_power = beacon_info.get(CONF_TX_POWER, self.tx_power)
-                path_loss_exponent = beacon_info.get(CONF_PATH_LOSS_EXPONENT, self.path_loss_exponent)
-                
-                self._trackers[mac] = BeaconTracker(
-                    mac=mac,
-                    name=name,
-                    tx_power=tx_power,
-                    path_loss_exponent=path_loss_exponent,
-                    rssi_smoothing=self.rssi_smoothing,
-                    position_smoothing=self.position_smoothing,
-                    max_reading_age=self.max_reading_age,
-                    icon=icon,
-                    category=category,
-                )
-                
-            # Update readings in tracker with beacon data
-            tracker = self._trackers[mac]
-            tracker.update_reading(proxy_id, rssi, timestamp, beacon_data)
-            
-            # Get proxy positions for triangulation
-            proxy_positions = {
-                p_id: {
-                    CONF_LATITUDE: info.get(CONF_LATITUDE),
-                    CONF_LONGITUDE: info.get(CONF_LONGITUDE),
-                }
-                for p_id, info in self.proxies.items()
-            }
-            
-            # Get distances from each proxy
-            distances = tracker.get_proxy_distances(proxy_positions)
+        # Update readings in tracker with beacon data
+        tracker.update_reading(proxy_id, rssi, timestamp, payload)
+        self._dirty_trackers.add(mac)
+        
+        # Get distances from each proxy
+        distances = tracker.get_proxy_distances(self._proxy_positions, current_time)
+        proxy_count = len(distances)
+
+        # The f-string debug messages below are built eagerly, so only
+        # format them when debug logging is actually enabled
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
             _LOGGER.debug(f"Beacon {mac} distances: {distances}")
+        
+        # Only attempt triangulation if we have enough proxies
+        update_position = False
+        
+        if proxy_count < self.min_proxies:
+            if debug_enabled:
+                _LOGGER.debug(
+                    f"Not enough proxies for triangulation. Beacon {mac} has {proxy_count} "
+                    f"proxies, need at least {self.min_proxies}"
+                )
+        elif not tracker.needs_triangulation(proxy_count):
+            if debug_enabled:
+                _LOGGER.debug(f"RSSI for beacon {mac} has not changed materially, skipping triangulation")
+        else:
+            # Perform triangulation
+            tracker.mark_triangulated(proxy_count)
+            latitude, longitude, accuracy = self.triangulator.trilaterate_2d(distances)
             
-            # Only attempt triangulation if we have enough proxies
-            update_position = False
-            
-            if len(distances) >= self.min_proxies:
-                # Perform triangulation
-                latitude, longitude, accuracy = self.triangulator.trilaterate_2d(distances)
+            if latitude is not None and longitude is not None:
+                # Update tracker position
+                tracker.update_position(latitude, longitude, accuracy, timestamp)
+                update_position = True
                 
-                if latitude is not None and longitude is not None:
-                    # Update tracker position
-                    tracker.update_position(latitude, longitude, accuracy, timestamp)
-                    update_position = True
-                    
-                    # Check if beacon has moved to a different zone
-                    prev_zone = tracker.zone
+                # Check if beacon has moved to a different zone
+                prev_zone = tracker.zone
+                tracker.prev_zone = prev_zone
+
+                # Only run the polygon tests when the beacon left its grid cell
+                # or the zones changed since the last lookup
+                zone_key = (
+                    int(latitude * ZONE_CACHE_BINS_PER_DEGREE),
+                    int(longitude * ZONE_CACHE_BINS_PER_DEGREE),
+                    self.zone_manager.version,
+                )
+                if zone_key != tracker.zone_key:
+                    tracker.zone_key = zone_key
                     current_zone = self.zone_manager.get_zone_for_point(latitude, longitude)
-                    
-                    # Update zone information
-                    tracker.prev_zone = prev_zone
-                    if current_zone:
-                        tracker.zone = current_zone.zone_id
-                    else:
-                        tracker.zone = None
-                        
-                    # Fire zone change event if zone has changed
+                    tracker.zone = current_zone.zone_id if current_zone else None
+
+                    # The zone only changes after a lookup, so fire the event here
                     if prev_zone != tracker.zone:
-                        zone_name = None
-                        if tracker.zone:
-                            zone_obj = self.zone_manager.get_zone_by_id(tracker.zone)
-                            if zone_obj:
-                                zone_name = zone_obj.name
-                                
+                        zone_name = current_zone.name if current_zone else None
+
                         _LOGGER.info(
                             f"Beacon {tracker.name} ({mac}) moved from zone "
                             f"{prev_zone or 'None'} to {tracker.zone or 'None'}"
                         )
-                        
+                    
                         self.hass.bus.async_fire(
                             EVENT_BEACON_ZONE_CHANGE,
                             {
@@ -765,166 +883,314 @@ class TriangulationManager:
                                 ATTR_GPS_ACCURACY: accuracy,
                             }
                         )
-                else:
-                    _LOGGER.debug(f"Triangulation failed for beacon {mac} with {len(distances)} proxies")
             else:
-                _LOGGER.debug(
-                    f"Not enough proxies for triangulation. Beacon {mac} has {len(distances)} "
-                    f"proxies, need at least {self.min_proxies}"
-                )
-            
-            # Fire beacon seen event
-            self.hass.bus.async_fire(
-                EVENT_BEACON_SEEN,
-                {
-                    ATTR_BEACON_MAC: mac,
-                    CONF_NAME: tracker.name,
-                    ATTR_PROXY_ID: proxy_id,
-                    ATTR_RSSI: rssi,
-                    ATTR_TIMESTAMP: timestamp,
-                    ATTR_DISTANCE: tracker.rssi_to_distance(rssi),
-                }
+                _LOGGER.debug(f"Triangulation failed for beacon {mac} with {proxy_count} proxies")
+        
+        # Queue beacon seen event for the next batch
+        distance = tracker.rssi_to_distance(rssi)
+        self._queue_seen_event({
+            ATTR_BEACON_MAC: mac,
+            CONF_NAME: tracker.name,
+            ATTR_PROXY_ID: proxy_id,
+            ATTR_RSSI: rssi,
+            ATTR_TIMESTAMP: timestamp,
+            ATTR_DISTANCE: distance,
+        })
+        
+        entity_id = tracker.entity_id
+        if entity_id not in self._update_subscribers:
+            return
+        payload = self._entity_payload(entity_id)
+
+        # The latest reading feeds the signal strength and distance sensors; it
+        # is kept current in the pooled state even when no update is queued
+        payload[ATTR_PROXY_ID] = proxy_id
+        payload[ATTR_RSSI] = rssi
+        payload[ATTR_DISTANCE] = distance
+
+        # Update the entities, unless the position they show has not changed
+        # since the last update (same position, zone and last-seen second)
+        last_seen = self._now_iso()
+        snapshot = _position_snapshot(
+            tracker.latitude, tracker.longitude, tracker.accuracy, tracker.zone, last_seen
+        )
+        if self._last_published.get(entity_id) != snapshot:
+            self._last_published[entity_id] = snapshot
+
+            # Fill the entity's pooled state in place and queue it, a later
+            # message in the same window simply overwrites the fields
+            payload[ATTR_LATITUDE] = tracker.latitude
+            payload[ATTR_LONGITUDE] = tracker.longitude
+            payload[ATTR_GPS_ACCURACY] = tracker.accuracy
+            payload[ATTR_LAST_SEEN] = last_seen
+            # Proxies that contributed to the position calculation (a tuple)
+            payload[ATTR_SOURCE_PROXIES] = tracker.source_proxies
+            payload[ATTR_ZONE] = tracker.zone
+            payload[ATTR_CATEGORY] = tracker.category
+            payload[ATTR_ICON] = tracker.icon
+            self._queue_entity_update(entity_id, payload)
+
+    def _now_iso(self) -> str:
+        """Return the current UTC time as ISO string, formatted at most once per second."""
+        second = int(time.time())
+        if self._iso_cache[0] != second:
+            self._iso_cache = (second, datetime.fromtimestamp(second, timezone.utc).isoformat())
+        return self._iso_cache[1]
+
+    @callback
+    def _queue_seen_event(self, event_data: Dict[str, Any]) -> None:
+        """Queue a beacon seen event and schedule the batch flush if needed."""
+        if self.fire_seen_events:
+            self.hass.bus.async_fire(EVENT_BEACON_SEEN, event_data)
+        self._pending_seen_events.append(event_data)
+        self._schedule_flush()
+
+    @callback
+    def _queue_entity_update(self, entity_id: str, state: Dict[str, Any]) -> None:
+        """Queue an entity state update, replacing any pending one for the entity."""
+        self._pending_entity_updates[entity_id] = state
+        self._schedule_flush()
+
+    @callback
+    def _schedule_flush(self) -> None:
+        """Schedule the batched flush of pending events and entity updates."""
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(
+                UPDATE_FLUSH_INTERVAL, self._flush_pending_updates
             )
-            
-            # Update the device tracker entity
-            entity_id = f"beacon_{mac.lower().replace(':', '_')}"
-            if entity_id in self._update_callbacks:
-                # Get the source proxies (those that contributed to the position calculation)
-                source_proxies = [p_id for p_id, _, _ in distances]
-                
-                # Call the entity callback with the updated state
-                self._update_callbacks[entity_id]({
-                    ATTR_LATITUDE: tracker.latitude,
-                    ATTR_LONGITUDE: tracker.longitude,
-                    ATTR_GPS_ACCURACY: tracker.accuracy,
-                    ATTR_LAST_SEEN: datetime.now(timezone.utc).isoformat(),
-                    ATTR_SOURCE_PROXIES: source_proxies,
-                    ATTR_ZONE: tracker.zone,
-                    ATTR_CATEGORY: tracker.category,
-                    ATTR_ICON: tracker.icon,
-                })
-                
-        except json.JSONDecodeError:
-            _LOGGER.error(f"Invalid JSON payload: {msg.payload}")
-        except Exception as e:
-            _LOGGER.exception(f"Error processing MQTT message: {e}")
 
-    async def _handle_proxy_status(self, proxy_id: str, payload: Dict[str, Any]) -> None:
+    @callback
+    def _flush_pending_updates(self) -> None:
+        """Push pending entity updates and fire queued seen events as one batch event."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if self._pending_entity_updates:
+            updates, self._pending_entity_updates = self._pending_entity_updates, {}
+            for entity_id, state in updates.items():
+                self._send_entity_update(entity_id, state)
+
+        if self._pending_seen_events:
+            events, self._pending_seen_events = self._pending_seen_events, []
+            self.hass.bus.async_fire(EVENT_BEACON_SEEN_BATCH, {"events": events})
+
+    @callback
+    def _schedule_config_entry_update(self, section: str, key: str, value: Optional[Dict[str, Any]]) -> None:
+        """Queue a beacon/proxy change (None removes it) for one debounced config entry update."""
+        self._pending_entry_updates.setdefault(section, {})[key] = value
+        if self._entry_update_unsub is None:
+            self._entry_update_unsub = async_call_later(
+                self.hass, CONFIG_ENTRY_UPDATE_DELAY, self._async_flush_config_entry
+            )
+
+    @callback
+    def _async_flush_config_entry(self, now=None) -> None:
+        """Apply all queued beacon/proxy changes to the config entry in a single update."""
+        if self._entry_update_unsub is not None:
+            self._entry_update_unsub()
+            self._entry_update_unsub = None
+
+        if not self._pending_entry_updates:
+            return
+
+        config = dict(self.config_entry.data)
+        for section, changes in self._pending_entry_updates.items():
+            # Copy the section so the current entry data is never mutated in place
+            items = dict(config.get(section, {}))
+            for key, value in changes.items():
+                if value is None:
+                    items.pop(key, None)
+                else:
+                    items[key] = value
+            config[section] = items
+        self._pending_entry_updates = {}
+
+        self.hass.config_entries.async_update_entry(self.config_entry, data=config)
+
+    @callback
+    def _async_add_detected_proxy(self, proxy_id: str, latitude: float, longitude: float) -> None:
+        """Register an auto-detected proxy in a background task."""
+        self._pending_proxy_adds.add(proxy_id)
+
+        async def _add() -> None:
+            try:
+                await self.add_proxy(proxy_id, latitude, longitude)
+                _LOGGER.info(f"Added auto-detected proxy {proxy_id} at ({latitude}, {longitude})")
+            finally:
+                self._pending_proxy_adds.discard(proxy_id)
+
+        self.hass.async_create_task(_add())
+
+    @callback
+    def _handle_proxy_status(self, proxy_id: str, payload: Dict[str, Any]) -> None:
         """Handle proxy status message with metadata."""
         try:
             current_time = time.time()
 
-            # Update proxy last seen timestamp
-            self._proxy_last_seen[proxy_id] = current_time
-
             # Auto-detect new proxy if not already known
-            if proxy_id not in self.proxies:
+            if proxy_id not in self.proxies and proxy_id not in self._pending_proxy_adds:
                 _LOGGER.info(f"Auto-detected new proxy from status message: {proxy_id}")
-                # Use home coordinates as default
-                latitude = self.hass.config.latitude
-                longitude = self.hass.config.longitude
-
-                # Add the proxy automatically
-                await self.add_proxy(proxy_id, latitude, longitude)
-                _LOGGER.info(f"Added auto-detected proxy {proxy_id} at ({latitude}, {longitude})")
+                # Add the proxy in the background at the home coordinates
+                self._async_add_detected_proxy(
+                    proxy_id, self.hass.config.latitude, self.hass.config.longitude
+                )
 
-            # Store proxy metadata
-            if proxy_id not in self._proxy_metadata:
-                self._proxy_metadata[proxy_id] = {}
-
-            # Update metadata fields
-            metadata = self._proxy_metadata[proxy_id]
-            metadata['status'] = payload.get('status', 'online')
-            metadata['ip_address'] = payload.get('ip_address')
-            metadata['mac_address'] = payload.get('mac_address')
-            metadata['wifi_ssid'] = payload.get('wifi_ssid')
-            metadata['wifi_rssi'] = payload.get('wifi_rssi')
-            metadata['hardware'] = payload.get('hardware', 'ESP32')
-            metadata['board'] = payload.get('board')
-            metadata['esphome_version'] = payload.get('esphome_version')
-            metadata['temperature'] = payload.get('temperature')
-            metadata['free_heap'] = payload.get('free_heap')
-            metadata['uptime'] = payload.get('uptime')
-            metadata['cpu_frequency'] = payload.get('cpu_frequency')
-            metadata['flash_size'] = payload.get('flash_size')
-            metadata['timestamp'] = payload.get('timestamp')
+            # Store proxy metadata, replacing the previous snapshot so dicts
+            # handed out by get_proxy_metadata are never mutated afterwards
+            metadata = {
+                key: payload.get(key, default) for key, default in PROXY_METADATA_FIELDS
+            }
             metadata['last_seen'] = current_time
-
-            # Clear any offline notifications for this proxy
-            notification_id = NOTIFICATION_PROXY_OFFLINE.format(proxy_id)
-            if notification_id in self._proxy_offline_notifications:
-                del self._proxy_offline_notifications[notification_id]
-
-                # Fire event for proxy coming back online
-                self.hass.bus.async_fire(
-                    EVENT_PROXY_STATUS_CHANGE,
-                    {
-                        ATTR_PROXY_ID: proxy_id,
-                        "status": metadata.get('status', 'online'),
-                        ATTR_LAST_SEEN: current_time,
-                        "ip_address": metadata.get('ip_address'),
-                        "wifi_ssid": metadata.get('wifi_ssid'),
-                        "wifi_rssi": metadata.get('wifi_rssi'),
-                        "temperature": metadata.get('temperature'),
-                        "uptime": metadata.get('uptime'),
-                    }
+            previous = self._proxy_metadata.get(proxy_id)
+            self._proxy_metadata[proxy_id] = metadata
+
+            # Update proxy last seen timestamp and mark it back online if needed
+            seen_time = time.monotonic()
+            came_online = self._mark_proxy_seen(proxy_id, seen_time, metadata)
+
+            # Only fire a status change event when the reported status differs
+            # from the last one, periodic status messages are not dispatched
+            if (
+                not came_online
+                and previous is not None
+                and previous['status'] != metadata['status']
+            ):
+                self._fire_proxy_status_event(proxy_id, seen_time, metadata)
+                _LOGGER.info(
+                    f"Proxy {proxy_id} status changed from {previous['status']} "
+                    f"to {metadata['status']}"
                 )
 
             # Log status update
-            _LOGGER.debug(
-                f"Updated proxy {proxy_id} status: "
-                f"IP={metadata.get('ip_address')}, "
-                f"WiFi={metadata.get('wifi_ssid')}@{metadata.get('wifi_rssi')}dBm, "
-                f"Temp={metadata.get('temperature')}°C, "
-                f"Uptime={metadata.get('uptime')}s"
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    f"Updated proxy {proxy_id} status: "
+                    f"IP={metadata['ip_address']}, "
+                    f"WiFi={metadata['wifi_ssid']}@{metadata['wifi_rssi']}dBm, "
+                    f"Temp={metadata['temperature']}°C, "
+                    f"Uptime={metadata['uptime']}s"
+                )
 
         except Exception as e:
             _LOGGER.error(f"Error handling proxy status for {proxy_id}: {e}")
 
     async def _subscribe_mqtt(self) -> None:
         """Subscribe to MQTT topics."""
-        if self._mqtt_subscription is not None:
+        if self._mqtt_subscriptions:
             return
-            
+
+        # One subscription per message type, so the broker only delivers topics we
+        # handle and each callback already knows what kind of message it gets
+        # ('+' matches a single level, so status topics never reach the beacon callback)
+        topics = (
+            (f"{self._status_topic_prefix}+{self._status_topic_suffix}", self._mqtt_status_received),
+            (f"{self._beacon_topic_prefix}+", self._mqtt_beacon_received),
+        )
         try:
-            self._mqtt_subscription = await mqtt.async_subscribe(
-                self.hass,
-                f"{self.mqtt_topic_prefix}/#",
-                self._mqtt_message_received,
-            )
-            _LOGGER.debug(f"Subscribed to MQTT topic: {self.mqtt_topic_prefix}/#")
+            for topic, msg_callback in topics:
+                self._mqtt_subscriptions.append(
+                    await mqtt.async_subscribe(self.hass, topic, msg_callback)
+                )
+                _LOGGER.debug(f"Subscribed to MQTT topic: {topic}")
         except Exception as e:
             _LOGGER.error(f"Error subscribing to MQTT: {e}")
 
     async def _unsubscribe_mqtt(self) -> None:
         """Unsubscribe from MQTT topics."""
-        if self._mqtt_subscription is not None:
-            self._mqtt_subscription()
-            self._mqtt_subscription = None
+        if self._mqtt_subscriptions:
+            # The unsubscribe callables are event loop callbacks, so they must not
+            # be moved to the executor
+            for unsubscribe in self._mqtt_subscriptions:
+                unsubscribe()
+            self._mqtt_subscriptions = []
             _LOGGER.debug("Unsubscribed from MQTT topics")
 
     async def _clean_old_readings(self, now=None) -> None:
         """Clean old readings in all trackers."""
-        # Clean old readings in all trackers
-        for tracker in self._trackers.values():
-            tracker.clean_old_readings()
+        # Only sweep trackers that received readings since the last run. Idle trackers
+        # can be skipped: get_proxy_distances cleans a tracker before any of its
+        # readings are used, so their stale readings are never observed
+        current_time = time.time()
+        for mac in self._dirty_trackers:
+            tracker = self._trackers.get(mac)
+            if tracker is not None:
+                tracker.clean_old_readings(current_time)
+        self._dirty_trackers.clear()
+
+    @callback
+    def _mark_proxy_seen(
+        self, proxy_id: str, seen_time: float, metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Record that a proxy was seen and handle its offline -> online transition.
+
+        seen_time is a time.monotonic() value. Returns True when the proxy was
+        marked back online and a status change event was fired.
+        """
+        self._proxy_last_seen[proxy_id] = seen_time
+
+        # Notifications are keyed by proxy_id, so the common case is a
+        # single dict lookup without formatting the notification id
+        if not self._proxy_offline_notifications:
+            return False
+
+        notification_id = self._proxy_offline_notifications.pop(proxy_id, None)
+        if notification_id is None:
+            return False
+
+        async_dismiss_notification(self.hass, notification_id)
+
+        # Fire event for proxy coming back online
+        self._fire_proxy_status_event(proxy_id, seen_time, metadata)
+        _LOGGER.info(f"Proxy {proxy_id} is back online")
+        return True
+
+    @callback
+    def _fire_proxy_status_event(
+        self, proxy_id: str, seen_time: float, metadata: Optional[Dict[str, Any]]
+    ) -> None:
+        """Fire a proxy status change event with the latest status fields."""
+        event_data = {ATTR_PROXY_ID: proxy_id, "status": "online"}
+        if metadata:
+            for key in PROXY_STATUS_EVENT_FIELDS:
+                event_data[key] = metadata.get(key)
+        event_data[ATTR_LAST_SEEN] = _monotonic_to_timestamp(seen_time)
+        self.hass.bus.async_fire(EVENT_PROXY_STATUS_CHANGE, event_data)
+
+    @callback
+    def _mark_beacon_seen(self, mac: str, seen_time: float) -> None:
+        """Record that a beacon was seen (at monotonic seen_time) and clear its missing notification."""
+        # Status checks work at a much coarser resolution, so coalesce the
+        # writes for beacons that advertise many times per second
+        if seen_time - self._beacon_last_seen.get(mac, 0) >= LAST_SEEN_WRITE_INTERVAL:
+            self._beacon_last_seen[mac] = seen_time
+
+        if not self._beacon_missing_notifications:
+            return
+
+        notification_id = self._beacon_missing_notifications.pop(mac, None)
+        if notification_id is None:
+            return
+
+        async_dismiss_notification(self.hass, notification_id)
+        _LOGGER.info(f"Beacon {mac} has been seen again")
 
     async def _check_devices_status(self, now=None) -> None:
         """Check status of proxies and beacons."""
-        current_time = time.time()
+        current_time = time.monotonic()
+        # Devices last seen before these cutoffs are offline/missing
+        proxy_cutoff = current_time - self.max_reading_age * 2
+        beacon_cutoff = current_time - self.max_reading_age * 3
         
         # Check for offline proxies
         for proxy_id in self.proxies:
             last_seen = self._proxy_last_seen.get(proxy_id)
             
-            if last_seen is None or (current_time - last_seen) > self.max_reading_age * 2:
-                # Proxy is considered offline
-                notification_id = NOTIFICATION_PROXY_OFFLINE.format(proxy_id)
-                
-                # Only create notification if we haven't already
-                if notification_id not in self._proxy_offline_notifications:
-                    self._proxy_offline_notifications[notification_id] = True
+            if last_seen is None or last_seen < proxy_cutoff:
+                # Proxy is considered offline, only create notification if we haven't already
+                if proxy_id not in self._proxy_offline_notifications:
+                    notification_id = NOTIFICATION_PROXY_OFFLINE.format(proxy_id)
+                    self._proxy_offline_notifications[proxy_id] = notification_id
                     
                     async_create_notification(
                         self.hass,
@@ -940,24 +1206,24 @@ class TriangulationManager:
                         {
                             ATTR_PROXY_ID: proxy_id,
                             "status": "offline",
-                            ATTR_LAST_SEEN: last_seen,
+                            ATTR_LAST_SEEN: _monotonic_to_timestamp(last_seen),
                         }
                     )
                     
-                    _LOGGER.warning(f"Proxy {proxy_id} is offline (last seen: {last_seen})")
+                    _LOGGER.warning(
+                        f"Proxy {proxy_id} is offline (last seen: {_monotonic_to_timestamp(last_seen)})"
+                    )
         
         # Check for missing beacons
         for mac, beacon_info in self.beacons.items():
             last_seen = self._beacon_last_seen.get(mac)
-            name = beacon_info.get(CONF_NAME, f"Beacon {mac}")
             
-            if last_seen is None or (current_time - last_seen) > self.max_reading_age * 3:
-                # Beacon is considered missing
-                notification_id = NOTIFICATION_BEACON_MISSING.format(mac)
-                
-                # Only create notification if we haven't already
-                if notification_id not in self._beacon_missing_notifications:
-                    self._beacon_missing_notifications[notification_id] = True
+            if last_seen is None or last_seen < beacon_cutoff:
+                # Beacon is considered missing, only create notification if we haven't already
+                if mac not in self._beacon_missing_notifications:
+                    notification_id = NOTIFICATION_BEACON_MISSING.format(mac)
+                    self._beacon_missing_notifications[mac] = notification_id
+                    name = beacon_info.get(CONF_NAME, f"Beacon {mac}")
                     
                     async_create_notification(
                         self.hass,
@@ -967,7 +1233,9 @@ class TriangulationManager:
                         notification_id=notification_id,
                     )
                     
-                    _LOGGER.warning(f"Beacon {name} ({mac}) is missing (last seen: {last_seen})")
+                    _LOGGER.warning(
+                        f"Beacon {name} ({mac}) is missing (last seen: {_monotonic_to_timestamp(last_seen)})"
+                    )
 
     async def set_beacon_position(
         self, 
@@ -1016,15 +1284,12 @@ class TriangulationManager:
             tracker.zone = current_zone.zone_id
         else:
             tracker.zone = None
-            
+        tracker.zone_key = None  # Force a fresh lookup on the next triangulated position
+
         # Fire zone change event if zone has changed
         if prev_zone != tracker.zone:
-            zone_name = None
-            if tracker.zone:
-                zone_obj = self.zone_manager.get_zone_by_id(tracker.zone)
-                if zone_obj:
-                    zone_name = zone_obj.name
-                    
+            zone_name = current_zone.name if current_zone else None
+
             _LOGGER.info(
                 f"Beacon {tracker.name} ({mac}) moved from zone "
                 f"{prev_zone or 'None'} to {tracker.zone or 'None'}"
@@ -1045,19 +1310,27 @@ class TriangulationManager:
             )
         
         # Update the device tracker entity
-        entity_id = f"beacon_{mac.lower().replace(':', '_')}"
-        if entity_id in self._update_callbacks:
-            # Call the entity callback with the updated state
-            self._update_callbacks[entity_id]({
-                ATTR_LATITUDE: lat,
-                ATTR_LONGITUDE: lng,
-                ATTR_GPS_ACCURACY: acc,
-                ATTR_LAST_SEEN: datetime.now(timezone.utc).isoformat(),
-                ATTR_SOURCE_PROXIES: [],  # No source proxies for manual position
-                ATTR_ZONE: tracker.zone,
-                ATTR_CATEGORY: tracker.category,
-                ATTR_ICON: tracker.icon,
-            })
+        entity_id = tracker.entity_id
+        # Skip the update if position, zone and last-seen second are unchanged
+        last_seen = self._now_iso()
+        snapshot = _position_snapshot(lat, lng, acc, tracker.zone, last_seen)
+        unchanged = prev_zone == tracker.zone and self._last_published.get(entity_id) == snapshot
+        if entity_id in self._update_subscribers and not unchanged:
+            self._last_published[entity_id] = snapshot
+            # The manual position must not be overwritten by a queued update
+            self._pending_entity_updates.pop(entity_id, None)
+
+            # Call the entity callbacks with the updated state
+            payload = self._entity_payload(entity_id)
+            payload[ATTR_LATITUDE] = lat
+            payload[ATTR_LONGITUDE] = lng
+            payload[ATTR_GPS_ACCURACY] = acc
+            payload[ATTR_LAST_SEEN] = last_seen
+            payload[ATTR_SOURCE_PROXIES] = ()  # No source proxies for manual position
+            payload[ATTR_ZONE] = tracker.zone
+            payload[ATTR_CATEGORY] = tracker.category
+            payload[ATTR_ICON] = tracker.icon
+            self._send_entity_update(entity_id, payload)
             
         _LOGGER.info(f"Manually set position for beacon {tracker.name} ({mac}) to ({lat}, {lng})")
         return True
@@ -1067,6 +1340,10 @@ class TriangulationManager:
         # Load configurations asynchronously
         self.beacons = await self._async_load_beacons()
         self.proxies = await self._async_load_proxies()
+        self._rebuild_proxy_positions()
+
+        # Create trackers for loaded beacons so _trackers covers every known beacon
+        self._initialize_trackers()
 
         # Load virtual users
         await self.discovery_manager.load_virtual_users()
@@ -1117,13 +1394,39 @@ class TriangulationManager:
             return False
 
         mac = self._format_mac_address(mac_address)
+        beacon_config = self._build_onboard_config(
+            mac,
+            name,
+            owner=owner,
+            category=category,
+            icon=icon,
+            notifications_enabled=notifications_enabled,
+            tracking_precision=tracking_precision,
+        )
+
+        # Save beacon configuration before touching the in-memory state
+        beacon_file = Path(self.hass.config.path(BEACON_CONFIG_DIR)) / f"{mac}.yaml"
+        await self._async_write_config_files([(beacon_file, beacon_config)])
 
+        self._register_onboarded_beacon(mac, beacon_config)
+        return True
+
+    def _build_onboard_config(
+        self,
+        mac: str,
+        name: str,
+        owner: Optional[str] = None,
+        category: str = BEACON_CATEGORY_ITEM,
+        icon: Optional[str] = None,
+        notifications_enabled: bool = True,
+        tracking_precision: str = "medium",
+    ) -> Dict[str, Any]:
+        """Build the config of a beacon being onboarded (MAC already validated and formatted)."""
         # Get beacon data from discovered beacons
         discovered_info = self.discovery_manager.discovered_beacons.get(mac, {})
         beacon_data = discovered_info.get('beacon_data', {})
 
-        # Build beacon configuration
-        beacon_config = {
+        return {
             'name': name,
             'mac': mac,
             'owner': owner,
@@ -1144,14 +1447,10 @@ class TriangulationManager:
             },
         }
 
-        # Save beacon configuration
-        beacon_dir = Path(self.hass.config.path(BEACON_CONFIG_DIR))
-        if not beacon_dir.exists():
-            await self.hass.async_add_executor_job(lambda: beacon_dir.mkdir(parents=True, exist_ok=True))
-
-        beacon_file = beacon_dir / f"{mac}.yaml"
-        content = yaml.dump(beacon_config)
-        await self.hass.async_add_executor_job(beacon_file.write_text, content)
+    @callback
+    def _register_onboarded_beacon(self, mac: str, beacon_config: Dict[str, Any]) -> None:
+        """Add an onboarded beacon, whose config file is written, to the in-memory state."""
+        name = beacon_config['name']
 
         # Add to in-memory config
         self.beacons[mac] = beacon_config
@@ -1161,22 +1460,13 @@ class TriangulationManager:
 
         # Create tracker for the beacon
         if mac not in self._trackers:
-            self._trackers[mac] = BeaconTracker(
-                mac=mac,
-                name=name,
-                rssi_smoothing_factor=self.rssi_smoothing,
-                position_smoothing_factor=self.position_smoothing,
-                max_reading_age=self.max_reading_age,
-                tx_power=self.tx_power,
-                path_loss_exponent=self.path_loss_exponent,
-            )
+            self._trackers[mac] = self._create_tracker(mac, beacon_config)
 
         # Register beacon with callbacks
-        for callback in self._beacon_callbacks:
-            callback(mac, name)
+        for callback_func in self._beacon_callbacks:
+            callback_func(mac, name)
 
         _LOGGER.info(f"Successfully onboarded beacon {name} ({mac})")
-        return True
 
     async def onboard_multiple_beacons(
         self,
@@ -1187,22 +1477,43 @@ class TriangulationManager:
     ) -> Dict[str, bool]:
         """Onboard multiple beacons at once."""
         results = {}
+        onboarded = []  # (mac_address as given, formatted mac, config)
         for beacon in beacons:
-            mac = beacon.get('mac')
-            name = beacon.get('name', f"Beacon {mac[-6:]}")
-            owner = beacon.get('owner', default_owner)
-            category = beacon.get('category', default_category)
-            icon = beacon.get('icon')
-
-            success = await self.onboard_beacon(
-                mac_address=mac,
-                name=name,
-                owner=owner,
-                category=category,
-                icon=icon,
+            mac_address = beacon.get('mac')
+
+            # Normalize once up front so onboarding can skip re-validation
+            if not mac_address or not self._validate_mac_address(mac_address):
+                _LOGGER.error(f"Invalid MAC address: {mac_address}")
+                results[mac_address] = False
+                continue
+            mac = self._format_mac_address(mac_address)
+
+            beacon_config = self._build_onboard_config(
+                mac,
+                beacon.get('name', f"Beacon {mac[-6:]}"),
+                owner=beacon.get('owner', default_owner),
+                category=beacon.get('category', default_category),
+                icon=beacon.get('icon'),
                 notifications_enabled=notifications_enabled,
             )
-            results[mac] = success
+            onboarded.append((mac_address, mac, beacon_config))
+
+        # Write all beacon files in a single executor job, before any of the
+        # beacons is added in memory, so a failed write leaves both unchanged
+        beacon_dir = Path(self.hass.config.path(BEACON_CONFIG_DIR))
+        try:
+            await self._async_write_config_files(
+                [(beacon_dir / f"{mac}.yaml", config) for _, mac, config in onboarded]
+            )
+        except Exception as e:
+            _LOGGER.error(f"Error writing beacon configs, no beacons onboarded: {e}")
+            for mac_address, _, _ in onboarded:
+                results[mac_address] = False
+            return results
+
+        for mac_address, mac, beacon_config in onboarded:
+            self._register_onboarded_beacon(mac, beacon_config)
+            results[mac_address] = True
 
         return results
 
@@ -1223,15 +1534,16 @@ class TriangulationManager:
         # Unsubscribe from MQTT
         await self._unsubscribe_mqtt()
         
-        # Cancel cleanup interval
-        if self._cleanup_interval:
-            self._cleanup_interval()
-            self._cleanup_interval = None
-            
-        # Cancel status check interval
-        if self._status_check_interval:
-            self._status_check_interval()
-            self._status_check_interval = None
+        # Cancel cleanup and status check intervals
+        for attr in ("_cleanup_interval", "_status_check_interval"):
+            cancel = getattr(self, attr)
+            if cancel is not None:
+                cancel()
+                setattr(self, attr, None)
+
+        # Write any batched config entry changes and events now rather than after the delay
+        self._async_flush_config_entry()
+        self._flush_pending_updates()
             
         _LOGGER.info("HA-BT-Advanced triangulation service stopped")
 
@@ -1254,38 +1566,28 @@ class TriangulationManager:
             
         mac = self._format_mac_address(mac_address)
         
-        if mac not in self.beacons:
+        tracker = self._trackers.get(mac)
+        if tracker is None:
             _LOGGER.error(f"Cannot calibrate unknown beacon: {mac}")
             return False
             
-        # Update beacon configuration
+        # Update beacon configuration and tracker
         beacon_config = self.beacons[mac]
         
         if tx_power is not None:
             beacon_config[CONF_TX_POWER] = tx_power
+            tracker.tx_power = tx_power
             
         if path_loss_exponent is not None:
             beacon_config[CONF_PATH_LOSS_EXPONENT] = path_loss_exponent
-            
-        # Update tracker
-        if mac in self._trackers:
-            tracker = self._trackers[mac]
-            if tx_power is not None:
-                tracker.tx_power = tx_power
-            if path_loss_exponent is not None:
-                tracker.path_loss_exponent = path_loss_exponent
+            tracker.path_loss_exponent = path_loss_exponent
                 
         # Save to file
-        beacon_dir = Path(self.hass.config.path(BEACON_CONFIG_DIR))
-        beacon_file = beacon_dir / f"{mac}.yaml"
-        
-        content = yaml.dump(beacon_config)
-        await self.hass.async_add_executor_job(beacon_file.write_text, content)
+        beacon_file = Path(self.hass.config.path(BEACON_CONFIG_DIR)) / f"{mac}.yaml"
+        await self._async_write_config_files([(beacon_file, beacon_config)])
             
         # Update config entry
-        config = dict(self.config_entry.data)
-        config[CONF_BEACONS] = {**config.get(CONF_BEACONS, {}), mac: beacon_config}
-        self.hass.config_entries.async_update_entry(self.config_entry, data=config)
+        self._schedule_config_entry_update(CONF_BEACONS, mac, beacon_config)
         
         _LOGGER.info(
             f"Calibrated beacon {beacon_config.get(CONF_NAME, mac)} ({mac}): "
@@ -1306,7 +1608,7 @@ class TriangulationManager:
 
         # Initialize calibration data
         self._calibration_mode[proxy_id] = {
-            "start_time": time.time(),
+            "start_time": time.monotonic(),
             "reference_distance": reference_distance,
             "duration": duration,
             "rssi_samples": []
@@ -1319,7 +1621,7 @@ class TriangulationManager:
         )
 
         # Create notification for user
-        await async_create_notification(
+        async_create_notification(
             self.hass,
             title="Proxy Calibration Started",
             message=(
@@ -1355,7 +1657,7 @@ class TriangulationManager:
                 "Need at least 5 samples for reliable calibration."
             )
             # Notify user of failure
-            await async_create_notification(
+            async_create_notification(
                 self.hass,
                 title="Calibration Failed",
                 message=(
@@ -1368,10 +1670,13 @@ class TriangulationManager:
             del self._calibration_mode[proxy_id]
             return
 
-        # Calculate statistics
-        import statistics
-        avg_rssi = statistics.mean(rssi_samples)
-        std_dev = statistics.stdev(rssi_samples) if len(rssi_samples) > 1 else 0
+        # Calculate statistics in float arithmetic (statistics.mean/stdev use exact
+        # fractions for integer samples, which gets slow for long calibrations)
+        sample_count = len(rssi_samples)
+        avg_rssi = math.fsum(rssi_samples) / sample_count
+        std_dev = math.sqrt(
+            math.fsum((rssi - avg_rssi) ** 2 for rssi in rssi_samples) / (sample_count - 1)
+        )
 
         # Calculate TX power at 1m using the reference distance
         # RSSI = TX_Power - 10 * n * log10(distance)
@@ -1382,7 +1687,6 @@ class TriangulationManager:
         n = self.path_loss_exponent
 
         # Calculate TX power at 1m
-        import math
         tx_power_at_1m = avg_rssi + 10 * n * math.log10(reference_distance)
 
         # Store results
@@ -1400,7 +1704,7 @@ class TriangulationManager:
         del self._calibration_mode[proxy_id]
 
         # Notify user of completion
-        await async_create_notification(
+        async_create_notification(
             self.hass,
             title="Calibration Complete",
             message=(
@@ -1426,6 +1730,13 @@ class TriangulationManager:
         """Get calibration results for a proxy."""
         return self._calibration_results.get(proxy_id)
 
+    def get_proxy_last_seen_age(self, proxy_id: str) -> Optional[float]:
+        """Get the seconds since a proxy was last seen, or None if never seen."""
+        seen_time = self._proxy_last_seen.get(proxy_id)
+        if not seen_time:
+            return None
+        return time.monotonic() - seen_time
+
     def get_proxy_metadata(self, proxy_id: str) -> Optional[Dict[str, Any]]:
         """Get metadata for a proxy from status messages."""
         return self._proxy_metadata.get(proxy_id)
@@ -1440,7 +1751,7 @@ class TriangulationManager:
             return False
 
         calibration_data = self._calibration_mode[proxy_id]
-        elapsed = time.time() - calibration_data["start_time"]
+        elapsed = time.monotonic() - calibration_data["start_time"]
 
         # Check if calibration is still active
         if elapsed > calibration_data["duration"]:
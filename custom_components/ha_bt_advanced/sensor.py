@@ -1,4 +1,5 @@
 """Sensor platform for BLE Triangulation."""
+from bisect import bisect_left
 import logging
 from typing import Any, Dict, Optional
 
@@ -23,6 +24,7 @@ from .const import (
     ATTR_RSSI,
     ATTR_DISTANCE,
     ATTR_GPS_ACCURACY,
+    ATTR_SOURCE_PROXIES,
     ATTR_ZONE,
     CONF_BEACON_CATEGORY,
     CATEGORY_ICONS,
@@ -31,6 +33,39 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Smallest changes worth a state write; filtered values jitter below these
+DISTANCE_CHANGE_THRESHOLD = 0.01  # m
+ACCURACY_CHANGE_THRESHOLD = 0.01  # m
+TEMPERATURE_CHANGE_THRESHOLD = 0.05  # °C
+
+# Battery icons by level: <= 10, <= 20, <= 40, <= 60, <= 80 and above 80 percent
+BATTERY_ICON_THRESHOLDS = (10, 20, 40, 60, 80)
+BATTERY_ICONS = (
+    "mdi:battery-alert",
+    "mdi:battery-20",
+    "mdi:battery-40",
+    "mdi:battery-60",
+    "mdi:battery-80",
+    "mdi:battery",
+)
+
+
+def _value_changed(old: Optional[float], new: Optional[float], threshold: float) -> bool:
+    """Return True if new differs from old by at least threshold (or one of them is None)."""
+    if old is None or new is None:
+        return old is not new
+    return abs(new - old) >= threshold
+
+
+def _beacon_device_info(slug: str, beacon_name: str) -> Dict[str, Any]:
+    """Return the device info shared by all sensors of a beacon."""
+    return {
+        "identifiers": {(DOMAIN, f"beacon_{slug}")},
+        "name": beacon_name,
+        "manufacturer": "iBeacon",
+        "model": "BLE Beacon",
+    }
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -83,8 +118,10 @@ class BLESignalStrengthSensor(SensorEntity):
         self.hass = hass
         self._manager = manager
         self._beacon_id = beacon_id
-        self._beacon_name = beacon_name
-        self._unique_id = f"beacon_{beacon_id.lower().replace(':', '_')}_signal"
+        slug = beacon_id.lower().replace(':', '_')
+        self._attr_name = f"{beacon_name} Signal Strength"
+        self._attr_unique_id = f"beacon_{slug}_signal"
+        self._attr_device_info = _beacon_device_info(slug, beacon_name)
         self._attr_icon = icon or "mdi:signal"
         
         # Initialize state
@@ -94,35 +131,20 @@ class BLESignalStrengthSensor(SensorEntity):
         self._attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
         self._attr_state_class = SensorStateClass.MEASUREMENT
         
-        # Register for updates
-        entity_id = f"beacon_{self._beacon_id.lower().replace(':', '_')}"
-        manager.register_update_callback(entity_id, self._async_update)
-        
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return f"{self._beacon_name} Signal Strength"
+        # Updates are published under the beacon's tracker id
+        self._update_id = f"beacon_{slug}"
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID of the sensor."""
-        return self._unique_id
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to state updates once the entity is added."""
+        self.async_on_remove(
+            self._manager.register_update_callback(self._update_id, self._async_update)
+        )
 
     @property
     def native_value(self) -> Optional[int]:
         """Return the RSSI value."""
         return self._rssi
 
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        """Return device information about this entity."""
-        return {
-            "identifiers": {(DOMAIN, f"beacon_{self._beacon_id.lower().replace(':', '_')}")},
-            "name": self._beacon_name,
-            "manufacturer": "iBeacon",
-            "model": "BLE Beacon",
-        }
-
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional attributes of the sensor."""
@@ -134,8 +156,13 @@ class BLESignalStrengthSensor(SensorEntity):
     def _async_update(self, data: Dict[str, Any]) -> None:
         """Update the sensor state."""
         if ATTR_RSSI in data:
-            self._rssi = data[ATTR_RSSI]
-            self._proxy_id = data.get("proxy_id")
+            rssi = data[ATTR_RSSI]
+            proxy_id = data.get("proxy_id")
+            if rssi == self._rssi and proxy_id == self._proxy_id:
+                return
+
+            self._rssi = rssi
+            self._proxy_id = proxy_id
             self.async_write_ha_state()
 
 
@@ -154,8 +181,10 @@ class BLEDistanceSensor(SensorEntity):
         self.hass = hass
         self._manager = manager
         self._beacon_id = beacon_id
-        self._beacon_name = beacon_name
-        self._unique_id = f"beacon_{beacon_id.lower().replace(':', '_')}_distance"
+        slug = beacon_id.lower().replace(':', '_')
+        self._attr_name = f"{beacon_name} Distance"
+        self._attr_unique_id = f"beacon_{slug}_distance"
+        self._attr_device_info = _beacon_device_info(slug, beacon_name)
         self._attr_icon = icon or "mdi:ruler"
         
         # Initialize state
@@ -165,35 +194,20 @@ class BLEDistanceSensor(SensorEntity):
         self._attr_device_class = SensorDeviceClass.DISTANCE
         self._attr_state_class = SensorStateClass.MEASUREMENT
         
-        # Register for updates
-        entity_id = f"beacon_{self._beacon_id.lower().replace(':', '_')}"
-        manager.register_update_callback(entity_id, self._async_update)
-        
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return f"{self._beacon_name} Distance"
+        # Updates are published under the beacon's tracker id
+        self._update_id = f"beacon_{slug}"
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID of the sensor."""
-        return self._unique_id
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to state updates once the entity is added."""
+        self.async_on_remove(
+            self._manager.register_update_callback(self._update_id, self._async_update)
+        )
 
     @property
     def native_value(self) -> Optional[float]:
         """Return the distance value."""
         return self._distance
 
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        """Return device information about this entity."""
-        return {
-            "identifiers": {(DOMAIN, f"beacon_{self._beacon_id.lower().replace(':', '_')}")},
-            "name": self._beacon_name,
-            "manufacturer": "iBeacon",
-            "model": "BLE Beacon",
-        }
-
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional attributes of the sensor."""
@@ -205,8 +219,16 @@ class BLEDistanceSensor(SensorEntity):
     def _async_update(self, data: Dict[str, Any]) -> None:
         """Update the sensor state."""
         if ATTR_DISTANCE in data:
-            self._distance = data[ATTR_DISTANCE]
-            self._proxy_id = data.get("proxy_id")
+            distance = data[ATTR_DISTANCE]
+            proxy_id = data.get("proxy_id")
+            if (
+                proxy_id == self._proxy_id
+                and not _value_changed(self._distance, distance, DISTANCE_CHANGE_THRESHOLD)
+            ):
+                return
+
+            self._distance = distance
+            self._proxy_id = proxy_id
             self.async_write_ha_state()
 
 
@@ -225,66 +247,60 @@ class BLEAccuracySensor(SensorEntity):
         self.hass = hass
         self._manager = manager
         self._beacon_id = beacon_id
-        self._beacon_name = beacon_name
-        self._unique_id = f"beacon_{beacon_id.lower().replace(':', '_')}_accuracy"
+        slug = beacon_id.lower().replace(':', '_')
+        self._attr_name = f"{beacon_name} Accuracy"
+        self._attr_unique_id = f"beacon_{slug}_accuracy"
+        self._attr_device_info = _beacon_device_info(slug, beacon_name)
         self._attr_icon = icon or "mdi:target"
         
         # Initialize state
         self._accuracy = None
+        self._source_proxies = ()
+        self._attr_extra_state_attributes = {}
         self._attr_native_unit_of_measurement = UnitOfLength.METERS
         self._attr_state_class = SensorStateClass.MEASUREMENT
         
-        # Register for updates
-        entity_id = f"beacon_{self._beacon_id.lower().replace(':', '_')}"
-        manager.register_update_callback(entity_id, self._async_update)
-        
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return f"{self._beacon_name} Accuracy"
+        # Updates are published under the beacon's tracker id
+        self._update_id = f"beacon_{slug}"
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID of the sensor."""
-        return self._unique_id
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to state updates once the entity is added."""
+        self.async_on_remove(
+            self._manager.register_update_callback(self._update_id, self._async_update)
+        )
 
     @property
     def native_value(self) -> Optional[float]:
         """Return the accuracy value."""
         return self._accuracy
 
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        """Return device information about this entity."""
-        return {
-            "identifiers": {(DOMAIN, f"beacon_{self._beacon_id.lower().replace(':', '_')}")},
-            "name": self._beacon_name,
-            "manufacturer": "iBeacon",
-            "model": "BLE Beacon",
-        }
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional attributes of the sensor."""
-        # Get the corresponding tracker
-        tracker = self._manager._trackers.get(self._beacon_id)
-        attrs = {}
-        
-        if tracker:
-            # Add number of contributing proxies
-            proxy_readings = tracker.proxy_readings
-            if proxy_readings:
-                attrs["num_proxies"] = len(proxy_readings)
-                attrs["contributing_proxies"] = list(proxy_readings.keys())
-                
-        return attrs
-
     @callback
     def _async_update(self, data: Dict[str, Any]) -> None:
         """Update the sensor state."""
-        if ATTR_GPS_ACCURACY in data:
-            self._accuracy = data[ATTR_GPS_ACCURACY]
-            self.async_write_ha_state()
+        if ATTR_GPS_ACCURACY not in data:
+            return
+        accuracy = data[ATTR_GPS_ACCURACY]
+        source_proxies = data.get(ATTR_SOURCE_PROXIES, ())
+
+        # Only write the state when the accuracy or the contributing proxies changed
+        if (
+            source_proxies == self._source_proxies
+            and not _value_changed(self._accuracy, accuracy, ACCURACY_CHANGE_THRESHOLD)
+        ):
+            return
+
+        self._accuracy = accuracy
+        self._source_proxies = source_proxies
+
+        # Attributes are only read on a state write, so build them here
+        attrs = {}
+        if source_proxies:
+            # Add number of contributing proxies
+            attrs["num_proxies"] = len(source_proxies)
+            attrs["contributing_proxies"] = list(source_proxies)
+        self._attr_extra_state_attributes = attrs
+
+        self.async_write_ha_state()
 
 
 class BLEZoneSensor(SensorEntity):
@@ -302,43 +318,30 @@ class BLEZoneSensor(SensorEntity):
         self.hass = hass
         self._manager = manager
         self._beacon_id = beacon_id
-        self._beacon_name = beacon_name
-        self._unique_id = f"beacon_{beacon_id.lower().replace(':', '_')}_zone"
+        slug = beacon_id.lower().replace(':', '_')
+        self._attr_name = f"{beacon_name} Zone"
+        self._attr_unique_id = f"beacon_{slug}_zone"
+        self._attr_device_info = _beacon_device_info(slug, beacon_name)
         self._attr_icon = icon or "mdi:map-marker"
         
         # Initialize state
         self._zone_id = None
         self._zone_name = None
         
-        # Register for updates
-        entity_id = f"beacon_{self._beacon_id.lower().replace(':', '_')}"
-        manager.register_update_callback(entity_id, self._async_update)
-        
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return f"{self._beacon_name} Zone"
+        # Updates are published under the beacon's tracker id
+        self._update_id = f"beacon_{slug}"
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID of the sensor."""
-        return self._unique_id
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to state updates once the entity is added."""
+        self.async_on_remove(
+            self._manager.register_update_callback(self._update_id, self._async_update)
+        )
 
     @property
     def native_value(self) -> Optional[str]:
         """Return the zone name as the value."""
         return self._zone_name
 
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        """Return device information about this entity."""
-        return {
-            "identifiers": {(DOMAIN, f"beacon_{self._beacon_id.lower().replace(':', '_')}")},
-            "name": self._beacon_name,
-            "manufacturer": "iBeacon",
-            "model": "BLE Beacon",
-        }
-
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional attributes of the sensor."""
@@ -358,18 +361,24 @@ class BLEZoneSensor(SensorEntity):
     def _async_update(self, data: Dict[str, Any]) -> None:
         """Update the sensor state."""
         if ATTR_ZONE in data:
-            self._zone_id = data[ATTR_ZONE]
+            zone_id = data[ATTR_ZONE]
             
             # Look up zone name
-            if self._zone_id and self._manager.zone_manager:
-                zone = self._manager.zone_manager.get_zone_by_id(self._zone_id)
+            if zone_id and self._manager.zone_manager:
+                zone = self._manager.zone_manager.get_zone_by_id(zone_id)
                 if zone:
-                    self._zone_name = zone.name
+                    zone_name = zone.name
                 else:
-                    self._zone_name = f"Unknown Zone ({self._zone_id})"
+                    zone_name = f"Unknown Zone ({zone_id})"
             else:
-                self._zone_name = "Not in a zone"
+                zone_name = "Not in a zone"
 
+            # Most updates are position changes within the same zone
+            if zone_id == self._zone_id and zone_name == self._zone_name:
+                return
+
+            self._zone_id = zone_id
+            self._zone_name = zone_name
             self.async_write_ha_state()
 
 
@@ -387,106 +396,84 @@ class BLEBatterySensor(SensorEntity):
         self.hass = hass
         self._manager = manager
         self._beacon_id = beacon_id
-        self._name = f"{beacon_name} Battery"
-        self._unique_id = f"beacon_{beacon_id.lower().replace(':', '_')}_battery"
+        slug = beacon_id.lower().replace(':', '_')
+        self._attr_name = f"{beacon_name} Battery"
+        self._attr_unique_id = f"beacon_{slug}_battery"
+        self._attr_device_info = _beacon_device_info(slug, beacon_name)
+        self._attr_native_unit_of_measurement = PERCENTAGE
+        self._attr_device_class = SensorDeviceClass.BATTERY
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_icon = "mdi:battery-unknown"
         self._state = None
         self._voltage = None
-
-        # Register for updates
-        manager.register_update_callback(self._unique_id, self._async_update)
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return self._name
-
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID of the sensor."""
-        return self._unique_id
-
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        """Return device information about this entity."""
-        return {
-            "identifiers": {(DOMAIN, f"beacon_{self._beacon_id.lower().replace(':', '_')}")},
-            "name": self._name.replace(" Battery", ""),
-            "manufacturer": "iBeacon",
-            "model": "BLE Beacon",
-        }
+        self._telemetry_key = None  # (packet_count, uptime minute) shown in the last write
+
+        # Updates are published under the beacon's tracker id
+        self._update_id = f"beacon_{slug}"
+
+    async def async_added_to_hass(self) -> None:
+        """Load the current telemetry and subscribe to state updates."""
+        # The first state write follows right after this, so include the
+        # telemetry the tracker already has
+        self._update_from_telemetry()
+        self.async_on_remove(
+            self._manager.register_update_callback(self._update_id, self._async_update)
+        )
 
     @property
     def native_value(self) -> Optional[float]:
         """Return the state of the sensor."""
         return self._state
 
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return the unit of measurement."""
-        return PERCENTAGE
-
-    @property
-    def device_class(self) -> str:
-        """Return the device class."""
-        return SensorDeviceClass.BATTERY
-
-    @property
-    def state_class(self) -> str:
-        """Return the state class."""
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        if self._state is not None:
-            if self._state > 80:
-                return "mdi:battery"
-            elif self._state > 60:
-                return "mdi:battery-80"
-            elif self._state > 40:
-                return "mdi:battery-60"
-            elif self._state > 20:
-                return "mdi:battery-40"
-            elif self._state > 10:
-                return "mdi:battery-20"
-            else:
-                return "mdi:battery-alert"
-        return "mdi:battery-unknown"
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional attributes."""
-        attrs = {}
-        if self._voltage is not None:
-            attrs["voltage"] = f"{self._voltage:.2f}V"
-
-        # Get telemetry from tracker
-        if self._beacon_id in self._manager._trackers:
-            tracker = self._manager._trackers[self._beacon_id]
-            if tracker.telemetry.get('packet_count'):
-                attrs["packet_count"] = tracker.telemetry['packet_count']
-            if tracker.telemetry.get('uptime_seconds'):
-                uptime = tracker.telemetry['uptime_seconds']
-                # Convert to human-readable format
-                days = uptime // 86400
-                hours = (uptime % 86400) // 3600
-                minutes = (uptime % 3600) // 60
-                attrs["uptime"] = f"{days}d {hours}h {minutes}m"
-
-        return attrs
-
     @callback
     def _async_update(self, data: Dict[str, Any]) -> None:
         """Update the sensor state."""
-        # Get telemetry from tracker
-        if self._beacon_id in self._manager._trackers:
-            tracker = self._manager._trackers[self._beacon_id]
-            if tracker.telemetry:
-                self._state = tracker.telemetry.get('battery_level')
-                self._voltage = tracker.telemetry.get('battery_voltage')
+        if self._update_from_telemetry():
+            self.async_write_ha_state()
 
-        # Update the entity state
-        self.async_write_ha_state()
+    def _update_from_telemetry(self) -> bool:
+        """Update state and attributes from the tracker telemetry, return True if changed."""
+        # Get telemetry from tracker
+        tracker = self._manager._trackers.get(self._beacon_id)
+        if tracker is None or not tracker.telemetry:
+            return False
+
+        telemetry = tracker.telemetry
+        state = telemetry.get('battery_level')
+        voltage = telemetry.get('battery_voltage')
+        # The uptime attribute is shown in minutes, so compare it per minute
+        uptime = telemetry.get('uptime_seconds')
+        telemetry_key = (telemetry.get('packet_count'), uptime // 60 if uptime else None)
+        if (
+            state == self._state
+            and voltage == self._voltage
+            and telemetry_key == self._telemetry_key
+        ):
+            return False
+
+        if state != self._state:
+            self._attr_icon = (
+                "mdi:battery-unknown" if state is None
+                else BATTERY_ICONS[bisect_left(BATTERY_ICON_THRESHOLDS, state)]
+            )
+        self._state = state
+        self._voltage = voltage
+        self._telemetry_key = telemetry_key
+
+        # Build the attributes together with the state they belong to
+        attrs = {}
+        if voltage is not None:
+            attrs["voltage"] = f"{voltage:.2f}V"
+        if telemetry.get('packet_count'):
+            attrs["packet_count"] = telemetry['packet_count']
+        if uptime:
+            # Convert to human-readable format
+            days = uptime // 86400
+            hours = (uptime % 86400) // 3600
+            minutes = (uptime % 3600) // 60
+            attrs["uptime"] = f"{days}d {hours}h {minutes}m"
+        self._attr_extra_state_attributes = attrs
+        return True
 
 
 class BLETemperatureSensor(SensorEntity):
@@ -503,85 +490,63 @@ class BLETemperatureSensor(SensorEntity):
         self.hass = hass
         self._manager = manager
         self._beacon_id = beacon_id
-        self._name = f"{beacon_name} Temperature"
-        self._unique_id = f"beacon_{beacon_id.lower().replace(':', '_')}_temperature"
+        slug = beacon_id.lower().replace(':', '_')
+        self._attr_name = f"{beacon_name} Temperature"
+        self._attr_unique_id = f"beacon_{slug}_temperature"
+        self._attr_device_info = _beacon_device_info(slug, beacon_name)
+        self._attr_icon = "mdi:thermometer"
+        self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+        self._attr_device_class = SensorDeviceClass.TEMPERATURE
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_extra_state_attributes = {}
         self._state = None
 
-        # Register for updates
-        manager.register_update_callback(self._unique_id, self._async_update)
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return self._name
-
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID of the sensor."""
-        return self._unique_id
+        # Updates are published under the beacon's tracker id
+        self._update_id = f"beacon_{slug}"
 
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        """Return device information about this entity."""
-        return {
-            "identifiers": {(DOMAIN, f"beacon_{self._beacon_id.lower().replace(':', '_')}")},
-            "name": self._name.replace(" Temperature", ""),
-            "manufacturer": "iBeacon",
-            "model": "BLE Beacon",
-        }
+    async def async_added_to_hass(self) -> None:
+        """Load the current telemetry and subscribe to state updates."""
+        # The first state write follows right after this, so include the
+        # telemetry the tracker already has
+        self._update_from_telemetry()
+        self.async_on_remove(
+            self._manager.register_update_callback(self._update_id, self._async_update)
+        )
 
     @property
     def native_value(self) -> Optional[float]:
         """Return the state of the sensor."""
         return self._state
 
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return the unit of measurement."""
-        return UnitOfTemperature.CELSIUS
-
-    @property
-    def device_class(self) -> str:
-        """Return the device class."""
-        return SensorDeviceClass.TEMPERATURE
-
-    @property
-    def state_class(self) -> str:
-        """Return the state class."""
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return "mdi:thermometer"
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional attributes."""
-        attrs = {}
-
-        # Get telemetry from tracker
-        if self._beacon_id in self._manager._trackers:
-            tracker = self._manager._trackers[self._beacon_id]
-            if tracker.telemetry.get('frame_types_seen'):
-                attrs["frame_types"] = list(tracker.telemetry['frame_types_seen'])
-
-        return attrs
-
     @callback
     def _async_update(self, data: Dict[str, Any]) -> None:
         """Update the sensor state."""
+        if self._update_from_telemetry():
+            self.async_write_ha_state()
+
+    def _update_from_telemetry(self) -> bool:
+        """Update state and attributes from the tracker telemetry, return True if changed."""
         # Get telemetry from tracker
-        if self._beacon_id in self._manager._trackers:
-            tracker = self._manager._trackers[self._beacon_id]
-            if tracker.telemetry:
-                temp = tracker.telemetry.get('temperature')
-                if temp is not None:
-                    # Convert from fixed point if needed
-                    if temp > 100:  # Likely in 8.8 fixed point format
-                        self._state = temp / 256.0
-                    else:
-                        self._state = temp
-
-        # Update the entity state
-        self.async_write_ha_state()
\ No newline at end of file
+        tracker = self._manager._trackers.get(self._beacon_id)
+        if tracker is None or not tracker.telemetry:
+            return False
+
+        temp = tracker.telemetry.get('temperature')
+        # Convert from fixed point if needed
+        if temp is not None and temp > 100:  # Likely in 8.8 fixed point format
+            temp = temp / 256.0
+        if temp is None:
+            temp = self._state  # Keep the last reading
+
+        frame_types = tracker.telemetry.get('frame_types_seen')
+        attrs = {"frame_types": list(frame_types)} if frame_types else {}
+
+        if (
+            not _value_changed(self._state, temp, TEMPERATURE_CHANGE_THRESHOLD)
+            and attrs == self._attr_extra_state_attributes
+        ):
+            return False
+
+        self._state = temp
+        self._attr_extra_state_attributes = attrs
+        return True
\ No newline at end of file
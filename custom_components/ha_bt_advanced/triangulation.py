@@ -3,42 +3,70 @@ import math
 import time
 from typing import Dict, List, Optional, Tuple, Any
 
+# Kalman process noise (m^2 per second) at position_smoothing = 1.0
+POSITION_PROCESS_NOISE_SCALE = 5.0
+
+# Triangulation gating: smoothed RSSI change (dB) that counts as movement,
+# and the minimum time (seconds) between triangulations of one beacon
+RSSI_CHANGE_THRESHOLD = 1.0
+MIN_TRIANGULATION_INTERVAL = 0.5
+
+# Outlier gate: readings further than this many standard deviations (never
+# less than the minimum, in dB) from the smoothed RSSI are not smoothed in
+RSSI_OUTLIER_SIGMAS = 3.0
+RSSI_OUTLIER_MIN_SIGMA = 2.0
+
 class RSSIBuffer:
-    """Maintains a rolling buffer of RSSI readings with timestamps."""
+    """Maintains an exponentially smoothed RSSI and the age of the newest reading.
+
+    Only O(1) state is kept: the smoothed value and the newest timestamp,
+    which is all that is needed to decide whether the value is still fresh.
+    """
 
     def __init__(self, max_age: float = 30.0, smoothing_factor: float = 0.3):
         """Initialize RSSI buffer."""
-        self.readings = []
         self.max_age = max_age
         self.smoothing_factor = smoothing_factor
         self.smoothed_rssi = None
+        self.deviation_variance = 0.0  # smoothed squared deviation from smoothed_rssi
+        self.last_timestamp = None
+        self.triangulated_rssi = None  # smoothed RSSI used by the last triangulation
+        # Distance computed from smoothed RSSI distance_rssi (None = not computed)
+        self.distance = None
+        self.distance_rssi = None
 
     def add_reading(self, rssi: int, timestamp: float):
         """Add a new RSSI reading with timestamp."""
-        self.readings.append((rssi, timestamp))
+        fresh = self.last_timestamp is not None
+        if self.last_timestamp is None or timestamp > self.last_timestamp:
+            self.last_timestamp = timestamp
         
         # Update smoothed RSSI using exponential moving average
         if self.smoothed_rssi is None:
             self.smoothed_rssi = rssi
-        else:
-            self.smoothed_rssi = (
-                self.smoothing_factor * rssi + 
-                (1 - self.smoothing_factor) * self.smoothed_rssi
-            )
+            return
+
+        # Multipath spikes are kept out of the average. The variance always
+        # learns the deviation, so a real level change is accepted after a
+        # reading or two while an isolated spike is dropped.
+        deviation = rssi - self.smoothed_rssi
+        gate = RSSI_OUTLIER_SIGMAS * max(self.deviation_variance ** 0.5, RSSI_OUTLIER_MIN_SIGMA)
+        self.deviation_variance += self.smoothing_factor * (deviation * deviation - self.deviation_variance)
+        if fresh and abs(deviation) > gate:
+            return
+
+        self.smoothed_rssi += self.smoothing_factor * deviation
 
     def clean_old_readings(self, current_time: float):
-        """Remove readings older than max_age."""
-        self.readings = [
-            (rssi, ts) for rssi, ts in self.readings 
-            if current_time - ts <= self.max_age
-        ]
+        """Forget the newest reading if it is older than max_age."""
+        if self.last_timestamp is not None and current_time - self.last_timestamp > self.max_age:
+            self.last_timestamp = None
 
     def get_average_rssi(self) -> Optional[float]:
-        """Get the average RSSI from recent readings."""
-        if not self.readings:
+        """Get the smoothed RSSI, or None if there is no recent reading."""
+        if self.last_timestamp is None:
             return None
         
-        # Return the smoothed value instead of simple average
         return self.smoothed_rssi
 
 
@@ -60,26 +88,42 @@ class BeaconTracker:
         """Initialize the beacon tracker."""
         self.mac = mac
         self.name = name
+        # Key the device tracker entity registers its update callback under
+        self.entity_id = f"beacon_{mac.lower().replace(':', '_')}"
+
+        # Dictionary of proxy_id -> RSSIBuffer
+        self.proxy_readings: Dict[str, RSSIBuffer] = {}
+
         self.tx_power = tx_power
-        self.path_loss_exponent = path_loss_exponent
+        self.path_loss_exponent = path_loss_exponent  # also sets the cached distance factor
         self.rssi_smoothing = rssi_smoothing
         self.max_reading_age = max_reading_age
         self.position_smoothing = position_smoothing
         self.icon = icon
         self.category = category
-        
-        # Dictionary of proxy_id -> RSSIBuffer
-        self.proxy_readings: Dict[str, RSSIBuffer] = {}
+
+        # Proxies behind the most recent get_proxy_distances() result, in order;
+        # a tuple so it can be handed to entities without copying
+        self.source_proxies: Tuple[str, ...] = ()
         
         # Last calculated position
         self.latitude = None
         self.longitude = None
         self.accuracy = None
         self.last_update = None
+
+        # Kalman filter position variance (m^2), shared by both axes
+        self.position_variance = None
+
+        # Triangulation gating state
+        self._triangulated_proxy_count = 0
+        self._last_triangulation = None  # time.monotonic() of the last triangulation
         
         # Current zone
         self.zone = None
         self.prev_zone = None
+        # (lat bin, lng bin, zone version) that self.zone was last computed for
+        self.zone_key = None
 
         # Telemetry data (from Eddystone TLM frames)
         self.telemetry = {
@@ -102,6 +146,34 @@ class BeaconTracker:
             'eddystone_url': None,
         }
 
+    @property
+    def tx_power(self) -> float:
+        """Return the calibrated RSSI at 1 m."""
+        return self._tx_power
+
+    @tx_power.setter
+    def tx_power(self, value: float) -> None:
+        """Set the TX power and drop the cached proxy distances."""
+        self._tx_power = value
+        self._invalidate_distances()
+
+    @property
+    def path_loss_exponent(self) -> float:
+        """Return the path loss exponent."""
+        return self._path_loss_exponent
+
+    @path_loss_exponent.setter
+    def path_loss_exponent(self, value: float) -> None:
+        """Set the path loss exponent and precompute 1 / (10 * n)."""
+        self._path_loss_exponent = value
+        self._distance_factor = 1.0 / (10 * value)
+        self._invalidate_distances()
+
+    def _invalidate_distances(self) -> None:
+        """Force the distances to be recomputed after a signal parameter change."""
+        for buffer in self.proxy_readings.values():
+            buffer.distance_rssi = None
+
     def update_telemetry(self, beacon_data: Dict[str, Any], timestamp: float):
         """Update telemetry data from beacon advertisement."""
         # Update battery data
@@ -152,21 +224,23 @@ class BeaconTracker:
 
     def update_reading(self, proxy_id: str, rssi: int, timestamp: float, beacon_data: Dict[str, Any] = None):
         """Update RSSI reading for a specific proxy."""
-        if proxy_id not in self.proxy_readings:
-            self.proxy_readings[proxy_id] = RSSIBuffer(
+        buffer = self.proxy_readings.get(proxy_id)
+        if buffer is None:
+            buffer = self.proxy_readings[proxy_id] = RSSIBuffer(
                 max_age=self.max_reading_age,
                 smoothing_factor=self.rssi_smoothing,
             )
 
-        self.proxy_readings[proxy_id].add_reading(rssi, timestamp)
+        buffer.add_reading(rssi, timestamp)
 
         # Update telemetry if beacon data provided
         if beacon_data:
             self.update_telemetry(beacon_data, timestamp)
 
-    def clean_old_readings(self):
+    def clean_old_readings(self, current_time: Optional[float] = None):
         """Remove old readings from all proxy buffers."""
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         for buffer in self.proxy_readings.values():
             buffer.clean_old_readings(current_time)
 
@@ -175,27 +249,74 @@ class BeaconTracker:
         if rssi == 0:
             return 100.0  # Arbitrary large distance for zero RSSI
             
-        ratio = (self.tx_power - rssi) / (10 * self.path_loss_exponent)
-        return 10 ** ratio
+        return 10 ** ((self.tx_power - rssi) * self._distance_factor)
+
+    def get_proxy_distances(
+        self, proxy_positions: Dict[str, Tuple[float, float]], current_time: Optional[float] = None
+    ) -> List[Tuple]:
+        """Get list of (lat, lng, distance) tuples for trilateration.
 
-    def get_proxy_distances(self, proxy_positions: Dict[str, Dict[str, float]]) -> List[Tuple]:
-        """Get list of (lat, lng, distance) tuples for trilateration."""
+        proxy_positions maps proxy ids to (lat, lng) tuples. The ids of the
+        proxies used are stored in source_proxies.
+        """
         result = []
-        current_time = time.time()
+        source_proxies = []
+        if current_time is None:
+            current_time = time.time()
+        tx_power = self.tx_power
+        distance_factor = self._distance_factor
         
         for proxy_id, buffer in self.proxy_readings.items():
             buffer.clean_old_readings(current_time)
             avg_rssi = buffer.get_average_rssi()
+            position = proxy_positions.get(proxy_id)
             
-            if avg_rssi is not None and proxy_id in proxy_positions:
-                distance = self.rssi_to_distance(avg_rssi)
-                lat = proxy_positions[proxy_id].get('latitude')
-                lng = proxy_positions[proxy_id].get('longitude')
-                if lat is not None and lng is not None:
-                    result.append((lat, lng, distance))
-                
+            if avg_rssi is not None and position is not None:
+                # A message updates one proxy's RSSI, so the other proxies'
+                # distances are reused until their smoothed RSSI changes
+                if buffer.distance_rssi != avg_rssi:
+                    buffer.distance_rssi = avg_rssi
+                    # Inlined rssi_to_distance with the cached path loss factor
+                    buffer.distance = (
+                        100.0 if avg_rssi == 0
+                        else 10 ** ((tx_power - avg_rssi) * distance_factor)
+                    )
+                result.append((position[0], position[1], buffer.distance))
+                source_proxies.append(proxy_id)
+
+        self.source_proxies = tuple(source_proxies)
         return result
 
+    def needs_triangulation(self, proxy_count: int) -> bool:
+        """Return True if the RSSI vector changed enough to triangulate again."""
+        if (
+            self._last_triangulation is not None
+            and time.monotonic() - self._last_triangulation < MIN_TRIANGULATION_INTERVAL
+        ):
+            return False
+
+        if proxy_count != self._triangulated_proxy_count:
+            return True
+
+        for buffer in self.proxy_readings.values():
+            rssi = buffer.get_average_rssi()
+            if rssi is None:
+                continue
+            if (
+                buffer.triangulated_rssi is None
+                or abs(rssi - buffer.triangulated_rssi) > RSSI_CHANGE_THRESHOLD
+            ):
+                return True
+
+        return False
+
+    def mark_triangulated(self, proxy_count: int):
+        """Remember the RSSI vector used for the current triangulation."""
+        for buffer in self.proxy_readings.values():
+            buffer.triangulated_rssi = buffer.get_average_rssi()
+        self._triangulated_proxy_count = proxy_count
+        self._last_triangulation = time.monotonic()
+
     def update_position(
         self, 
         lat: float, 
@@ -203,27 +324,34 @@ class BeaconTracker:
         accuracy: float, 
         timestamp: float
     ):
-        """Update beacon position with smoothing."""
-        if self.latitude is None or self.longitude is None:
+        """Update beacon position with a Kalman filter.
+
+        Each axis is a random walk whose process noise grows with
+        position_smoothing; the measurement noise is the trilateration
+        accuracy. The reported accuracy is the filter's standard deviation.
+        """
+        measurement_variance = max(accuracy or 1.0, 1.0) ** 2
+
+        if self.latitude is None or self.longitude is None or self.position_variance is None:
             # First position update
             self.latitude = lat
             self.longitude = lng
-            self.accuracy = accuracy
+            self.position_variance = measurement_variance
         else:
-            # Apply exponential moving average smoothing
-            self.latitude = (
-                self.position_smoothing * lat + 
-                (1 - self.position_smoothing) * self.latitude
+            # Predict: uncertainty grows with the time since the last update
+            dt = max(0.0, timestamp - self.last_update) if self.last_update is not None else 0.0
+            variance = (
+                self.position_variance
+                + self.position_smoothing * POSITION_PROCESS_NOISE_SCALE * dt
             )
-            self.longitude = (
-                self.position_smoothing * lng + 
-                (1 - self.position_smoothing) * self.longitude
-            )
-            self.accuracy = (
-                self.position_smoothing * accuracy + 
-                (1 - self.position_smoothing) * self.accuracy
-            )
-            
+
+            # Update: blend in the measurement by the Kalman gain
+            gain = variance / (variance + measurement_variance)
+            self.latitude += gain * (lat - self.latitude)
+            self.longitude += gain * (lng - self.longitude)
+            self.position_variance = (1 - gain) * variance
+
+        self.accuracy = max(1.0, self.position_variance ** 0.5)
         self.last_update = timestamp
 
     def to_dict(self) -> Dict[str, Any]:
@@ -294,38 +422,35 @@ class Triangulator:
         # Weighted average of circle intersections
         x_sum = 0
         y_sum = 0
+        hypot = math.hypot
+        count = len(xy_points)
         
-        for i, (x1, y1, r1) in enumerate(xy_points):
-            for j in range(i+1, len(xy_points)):
+        for i in range(count):
+            x1, y1, r1 = xy_points[i]
+            w1 = weights[i]
+            for j in range(i+1, count):
                 x2, y2, r2 = xy_points[j]
+                dx = x2 - x1
+                dy = y2 - y1
                 
                 # Distance between centers
-                d = math.sqrt((x2-x1)**2 + (y2-y1)**2)
+                d = hypot(dx, dy)
                 
                 # No solution if circles are too far apart or one contains the other
                 if d > r1 + r2 or d < abs(r1 - r2):
                     continue
                 
-                # Math for circle intersection
-                a = (r1*r1 - r2*r2 + d*d) / (2*d)
-                h = math.sqrt(max(0, r1*r1 - a*a))  # Use max to avoid negative sqrt
-                
-                x3 = x1 + a * (x2 - x1) / d
-                y3 = y1 + a * (y2 - y1) / d
-                
-                # Two intersection points
-                x4_1 = x3 + h * (y2 - y1) / d
-                y4_1 = y3 - h * (x2 - x1) / d
-                
-                x4_2 = x3 - h * (y2 - y1) / d
-                y4_2 = y3 + h * (x2 - x1) / d
+                # The two intersection points are symmetric about the chord midpoint
+                # (x1, y1) + a * (dx, dy) / d, so their average is that midpoint and
+                # the half-chord length never needs to be computed
+                a_over_d = (r1*r1 - r2*r2 + d*d) / (2*d*d)
                 
                 # Calculate the weight for this pair based on distance measurement confidence
-                pair_weight = weights[i] * weights[j]
+                pair_weight = w1 * weights[j]
                 
-                # Add both intersection points with weight
-                x_sum += (x4_1 + x4_2) * pair_weight / 2
-                y_sum += (y4_1 + y4_2) * pair_weight / 2
+                # Add the midpoint of both intersection points with weight
+                x_sum += (x1 + a_over_d * dx) * pair_weight
+                y_sum += (y1 + a_over_d * dy) * pair_weight
         
         # Check if we have any valid intersections
         if x_sum == 0 and y_sum == 0:
@@ -342,10 +467,7 @@ class Triangulator:
             y_result = y_sum / total_weight
             
         # Calculate accuracy from residuals
-        residuals = []
-        for x, y, r in xy_points:
-            actual_dist = math.sqrt((x_result - x)**2 + (y_result - y)**2)
-            residuals.append(abs(actual_dist - r))
+        residuals = [abs(hypot(x_result - x, y_result - y) - r) for x, y, r in xy_points]
             
         # Use the average residual as our accuracy estimate
         if residuals:
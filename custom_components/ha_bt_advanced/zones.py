@@ -22,8 +22,45 @@ from .const import (
 )
 from .triangulation import Triangulator
 
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeDumper, SafeLoader
+
 _LOGGER = logging.getLogger(__name__)
 
+
+def _load_zone_files(zone_dir: Path) -> List[Tuple[Path, Any]]:
+    """Read and parse all zone YAML files (runs in executor)."""
+    if not zone_dir.exists():
+        zone_dir.mkdir(parents=True, exist_ok=True)
+        return []
+
+    results = []
+    for file_path in zone_dir.glob("*.yaml"):
+        try:
+            results.append((file_path, yaml.load(file_path.read_text(), Loader=SafeLoader)))
+        except Exception as e:
+            _LOGGER.error(f"Error loading zone from {file_path}: {e}")
+
+    return results
+
+
+def _write_zone_file(zone_file: Path, data: Dict[str, Any]) -> None:
+    """Serialize and atomically write a zone file (runs in executor)."""
+    content = yaml.dump(data, Dumper=SafeDumper, default_flow_style=False)
+    zone_file.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temp file and rename so a crash never leaves a truncated zone
+    tmp_path = zone_file.with_name(f"{zone_file.name}.tmp")
+    tmp_path.write_text(content)
+    os.replace(tmp_path, zone_file)
+
+
+def _remove_zone_file(zone_file: Path) -> None:
+    """Remove a zone file if it exists (runs in executor)."""
+    zone_file.unlink(missing_ok=True)
+
+
 class Zone:
     """Represent a zone for BLE tracking."""
 
@@ -42,8 +79,23 @@ class Zone:
         self.coordinates = coordinates
         self.icon = icon
 
+        # Bounding box (min_lat, max_lat, min_lng, max_lng) for cheap rejection
+        if coordinates:
+            lats = [point[0] for point in coordinates]
+            lngs = [point[1] for point in coordinates]
+            self._bbox = (min(lats), max(lats), min(lngs), max(lngs))
+        else:
+            self._bbox = None
+
     def contains_point(self, lat: float, lng: float) -> bool:
         """Check if this zone contains a specific point."""
+        if self._bbox is None:
+            return False
+
+        min_lat, max_lat, min_lng, max_lng = self._bbox
+        if not (min_lat <= lat <= max_lat and min_lng <= lng <= max_lng):
+            return False
+
         return Triangulator.check_point_in_polygon((lat, lng), self.coordinates)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -75,31 +127,31 @@ class ZoneManager:
         """Initialize the ZoneManager."""
         self.hass = hass
         self.zones: Dict[str, Zone] = {}
-        self._load_zones()
+        # Incremented whenever zones change, so cached zone lookups can be invalidated
+        self.version = 0
 
-    def _load_zones(self) -> None:
+    async def async_load_zones(self) -> None:
         """Load zones from configuration files."""
         zone_dir = Path(self.hass.config.path(ZONE_CONFIG_DIR))
-        
-        if not zone_dir.exists():
-            zone_dir.mkdir(parents=True, exist_ok=True)
-            return
-            
-        for file_path in zone_dir.glob("*.yaml"):
-            try:
-                with open(file_path, "r") as f:
-                    zone_data = yaml.safe_load(f)
-                    if zone_data and isinstance(zone_data, dict):
-                        zone_id = file_path.stem
-                        if CONF_ZONE_NAME in zone_data and CONF_ZONE_TYPE in zone_data and CONF_ZONE_COORDINATES in zone_data:
-                            self.zones[zone_id] = Zone.from_dict({
-                                CONF_ZONE_ID: zone_id,
-                                **zone_data
-                            })
-                        else:
-                            _LOGGER.warning(f"Zone file {file_path} missing required fields")
-            except Exception as e:
-                _LOGGER.error(f"Error loading zone from {file_path}: {e}")
+
+        # Read and parse all files in a single executor job
+        for file_path, zone_data in await self.hass.async_add_executor_job(
+            _load_zone_files, zone_dir
+        ):
+            if zone_data and isinstance(zone_data, dict):
+                zone_id = file_path.stem
+                if CONF_ZONE_NAME in zone_data and CONF_ZONE_TYPE in zone_data and CONF_ZONE_COORDINATES in zone_data:
+                    try:
+                        self.zones[zone_id] = Zone.from_dict({
+                            CONF_ZONE_ID: zone_id,
+                            **zone_data
+                        })
+                    except Exception as e:
+                        _LOGGER.error(f"Error loading zone from {file_path}: {e}")
+                else:
+                    _LOGGER.warning(f"Zone file {file_path} missing required fields")
+
+        self.version += 1
 
     async def add_zone(
         self,
@@ -119,31 +171,28 @@ class ZoneManager:
             icon=icon,
         )
         
-        # Save to file
-        zone_dir = Path(self.hass.config.path(ZONE_CONFIG_DIR))
-        zone_dir.mkdir(parents=True, exist_ok=True)
-        
-        zone_file = zone_dir / f"{zone_id}.yaml"
-        with open(zone_file, "w") as f:
-            yaml.dump(zone.to_dict(), f, default_flow_style=False)
-            
+        # Save to file, the safe dumper needs coordinates as lists
+        zone_file = Path(self.hass.config.path(ZONE_CONFIG_DIR)) / f"{zone_id}.yaml"
+        zone_data = zone.to_dict()
+        zone_data[CONF_ZONE_COORDINATES] = [list(point) for point in coordinates]
+        await self.hass.async_add_executor_job(_write_zone_file, zone_file, zone_data)
+
         # Add to in-memory zones
         self.zones[zone_id] = zone
+        self.version += 1
         
         return zone
 
     async def remove_zone(self, zone_id: str) -> bool:
         """Remove a zone."""
         # Remove file
-        zone_dir = Path(self.hass.config.path(ZONE_CONFIG_DIR))
-        zone_file = zone_dir / f"{zone_id}.yaml"
-        
-        if zone_file.exists():
-            zone_file.unlink()
-            
+        zone_file = Path(self.hass.config.path(ZONE_CONFIG_DIR)) / f"{zone_id}.yaml"
+        await self.hass.async_add_executor_job(_remove_zone_file, zone_file)
+
         # Remove from in-memory zones
         if zone_id in self.zones:
             del self.zones[zone_id]
+            self.version += 1
             return True
             
         return False
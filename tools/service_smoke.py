@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Smoke check for the standalone triangulation service.
+
+Drives MQTTHandler.process_beacon_message with readings from three proxies
+through triangulation to the batched state publish, using a client that
+records publishes instead of talking to a broker. Needs the packages from
+triangulation_service/requirements.txt.
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "triangulation_service"))
+
+import main  # noqa: E402
+
+PROXIES = {
+    "proxy_a": {"latitude": 52.0, "longitude": 5.0},
+    "proxy_b": {"latitude": 52.0001, "longitude": 5.0},
+    "proxy_c": {"latitude": 52.0, "longitude": 5.0002},
+}
+BEACON_MAC = "AA:BB:CC:DD:EE:FF"
+
+
+class RecordingClient:
+    """Stand-in for the MQTT client that keeps every publish."""
+
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, topic, payload, qos=0, retain=False):
+        self.published.append((topic, payload))
+
+
+async def run() -> int:
+    client = RecordingClient()
+    handler = main.MQTTHandler(client, PROXIES, {}, {}, min_proxies=2)
+    state_topic = f"{main.MQTT_STATE_PREFIX}/{handler.mac_to_topic(BEACON_MAC)}"
+
+    # Two rounds so the second passes the triangulation gate and the Kalman update
+    for rssi_values in ((-60, -65, -70), (-75, -58, -66)):
+        for proxy_id, rssi in zip(PROXIES, rssi_values):
+            await handler.process_beacon_message(proxy_id, {
+                "beacon_mac": BEACON_MAC,
+                "rssi": rssi,
+                "timestamp": main.iso_timestamp(time.time()),
+            })
+        await asyncio.sleep(main.MIN_TRIANGULATION_INTERVAL + 0.1)
+
+    await asyncio.sleep(main.PUBLISH_FLUSH_INTERVAL + 0.1)
+
+    states = [payload for topic, payload in client.published if topic == state_topic]
+    if not states:
+        print(f"✗ No state published to {state_topic}")
+        return 1
+
+    state = json.loads(states[-1])
+    if state.get("latitude") is None or state.get("longitude") is None:
+        print(f"✗ Published state has no position: {state}")
+        return 1
+
+    print(f"✓ Service published {len(states)} position(s), last: {state}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run()))
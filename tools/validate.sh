@@ -199,5 +199,18 @@ else
   echo "✗ English translations do not exist"
 fi
 
+# Smoke check the standalone triangulation service
 echo ""
-echo "Validation complete!"
\ No newline at end of file
+echo "Checking standalone triangulation service"
+if python3 -c "import asyncio_mqtt, paho.mqtt, yaml" &> /dev/null; then
+  if python3 tools/service_smoke.py; then
+    echo "✓ Service publishes triangulated positions"
+  else
+    echo "✗ Service smoke check failed"
+  fi
+else
+  echo "Service dependencies not installed - skipping service smoke check"
+fi
+
+echo ""
+echo "Validation complete!"
@@ -10,18 +10,26 @@ entities to Home Assistant via MQTT Auto-discovery.
 import asyncio
 import json
 import logging
+import math
 import os
 import re
 import signal
 import sys
 import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import yaml
 import asyncio_mqtt as mqtt
 from paho.mqtt import client as mqtt_client
 
+try:
+    # orjson decodes and encodes small MQTT payloads several times faster than
+    # the stdlib; its JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -35,6 +43,34 @@ MQTT_DISCOVERY_PREFIX = "homeassistant"
 MQTT_STATE_PREFIX = "ble-location"
 MQTT_PROXY_PREFIX = "ble-triangulation"
 
+# Interval (seconds) over which outgoing state publishes are coalesced
+PUBLISH_FLUSH_INTERVAL = 0.1
+
+# Kalman process noise (m^2 per second) at position_smoothing = 1.0
+POSITION_PROCESS_NOISE_SCALE = 5.0
+
+# Triangulation gating: smoothed RSSI change (dB) that counts as movement,
+# and the minimum time (seconds) between triangulations of one beacon
+RSSI_CHANGE_THRESHOLD = 1.0
+MIN_TRIANGULATION_INTERVAL = 0.5
+
+# Outlier gate: readings further than this many standard deviations (never
+# less than the minimum, in dB) from the smoothed RSSI are not smoothed in
+RSSI_OUTLIER_SIGMAS = 3.0
+RSSI_OUTLIER_MIN_SIGMA = 2.0
+
+# (whole second, ISO string) cache for published timestamps
+_iso_cache = (0, "")
+
+
+def iso_timestamp(timestamp: float) -> str:
+    """Return a UNIX timestamp as UTC ISO string, formatted at most once per second."""
+    global _iso_cache
+    second = int(timestamp)
+    if _iso_cache[0] != second:
+        _iso_cache = (second, datetime.fromtimestamp(second, timezone.utc).isoformat())
+    return _iso_cache[1]
+
 
 class RSSIBuffer:
     """Maintains a rolling buffer of RSSI readings with timestamps."""
@@ -44,19 +80,29 @@ class RSSIBuffer:
         self.max_age = max_age
         self.smoothing_factor = smoothing_factor
         self.smoothed_rssi = None
+        self.deviation_variance = 0.0  # smoothed squared deviation from smoothed_rssi
+        self.triangulated_rssi = None  # smoothed RSSI used by the last triangulation
 
     def add_reading(self, rssi: int, timestamp: float):
         """Add a new RSSI reading with timestamp."""
+        fresh = bool(self.readings)
         self.readings.append((rssi, timestamp))
         
         # Update smoothed RSSI using exponential moving average
         if self.smoothed_rssi is None:
             self.smoothed_rssi = rssi
-        else:
-            self.smoothed_rssi = (
-                self.smoothing_factor * rssi + 
-                (1 - self.smoothing_factor) * self.smoothed_rssi
-            )
+            return
+
+        # Multipath spikes are kept out of the average. The variance always
+        # learns the deviation, so a real level change is accepted after a
+        # reading or two while an isolated spike is dropped.
+        deviation = rssi - self.smoothed_rssi
+        gate = RSSI_OUTLIER_SIGMAS * max(self.deviation_variance ** 0.5, RSSI_OUTLIER_MIN_SIGMA)
+        self.deviation_variance += self.smoothing_factor * (deviation * deviation - self.deviation_variance)
+        if fresh and abs(deviation) > gate:
+            return
+
+        self.smoothed_rssi += self.smoothing_factor * deviation
 
     def clean_old_readings(self, current_time: float):
         """Remove readings older than max_age."""
@@ -90,8 +136,9 @@ class BeaconTracker:
         self.mac = mac
         self.name = name
         self.tx_power = tx_power
-        self.path_loss_exponent = path_loss_exponent
+        self.path_loss_exponent = path_loss_exponent  # also sets the cached distance factor
         self.max_reading_age = max_reading_age
+        self.rssi_smoothing = rssi_smoothing
         self.position_smoothing = position_smoothing
         
         # Dictionary of proxy_id -> RSSIBuffer
@@ -103,12 +150,30 @@ class BeaconTracker:
         self.accuracy = None
         self.last_update = None
 
+        # Kalman filter position variance (m^2), shared by both axes
+        self.position_variance = None
+
+        # Triangulation gating state
+        self._triangulated_proxy_count = 0
+        self._last_triangulation = None
+
+    @property
+    def path_loss_exponent(self) -> float:
+        """Return the path loss exponent."""
+        return self._path_loss_exponent
+
+    @path_loss_exponent.setter
+    def path_loss_exponent(self, value: float) -> None:
+        """Set the path loss exponent and precompute 1 / (10 * n)."""
+        self._path_loss_exponent = value
+        self._distance_factor = 1.0 / (10 * value)
+
     def update_reading(self, proxy_id: str, rssi: int, timestamp: float):
         """Update RSSI reading for a specific proxy."""
         if proxy_id not in self.proxy_readings:
             self.proxy_readings[proxy_id] = RSSIBuffer(
                 max_age=self.max_reading_age,
-                smoothing_factor=rssi_smoothing,
+                smoothing_factor=self.rssi_smoothing,
             )
         
         self.proxy_readings[proxy_id].add_reading(rssi, timestamp)
@@ -124,8 +189,7 @@ class BeaconTracker:
         if rssi == 0:
             return 100.0  # Arbitrary large distance for zero RSSI
             
-        ratio = (self.tx_power - rssi) / (10 * self.path_loss_exponent)
-        return 10 ** ratio
+        return 10 ** ((self.tx_power - rssi) * self._distance_factor)
 
     def get_proxy_distances(self, proxy_positions: Dict[str, Dict[str, float]]) -> List[Tuple]:
         """Get list of (lat, lng, distance) tuples for trilateration."""
@@ -144,6 +208,36 @@ class BeaconTracker:
                 
         return result
 
+    def needs_triangulation(self, proxy_count: int) -> bool:
+        """Return True if the RSSI vector changed enough to triangulate again."""
+        if (
+            self._last_triangulation is not None
+            and time.monotonic() - self._last_triangulation < MIN_TRIANGULATION_INTERVAL
+        ):
+            return False
+
+        if proxy_count != self._triangulated_proxy_count:
+            return True
+
+        for buffer in self.proxy_readings.values():
+            rssi = buffer.get_average_rssi()
+            if rssi is None:
+                continue
+            if (
+                buffer.triangulated_rssi is None
+                or abs(rssi - buffer.triangulated_rssi) > RSSI_CHANGE_THRESHOLD
+            ):
+                return True
+
+        return False
+
+    def mark_triangulated(self, proxy_count: int):
+        """Remember the RSSI vector used for the current triangulation."""
+        for buffer in self.proxy_readings.values():
+            buffer.triangulated_rssi = buffer.get_average_rssi()
+        self._triangulated_proxy_count = proxy_count
+        self._last_triangulation = time.monotonic()
+
     def update_position(
         self, 
         lat: float, 
@@ -151,27 +245,34 @@ class BeaconTracker:
         accuracy: float, 
         timestamp: float
     ):
-        """Update beacon position with smoothing."""
-        if self.latitude is None or self.longitude is None:
+        """Update beacon position with a Kalman filter.
+
+        Each axis is a random walk whose process noise grows with
+        position_smoothing; the measurement noise is the trilateration
+        accuracy. The reported accuracy is the filter's standard deviation.
+        """
+        measurement_variance = max(accuracy or 1.0, 1.0) ** 2
+
+        if self.latitude is None or self.longitude is None or self.position_variance is None:
             # First position update
             self.latitude = lat
             self.longitude = lng
-            self.accuracy = accuracy
+            self.position_variance = measurement_variance
         else:
-            # Apply exponential moving average smoothing
-            self.latitude = (
-                self.position_smoothing * lat + 
-                (1 - self.position_smoothing) * self.latitude
-            )
-            self.longitude = (
-                self.position_smoothing * lng + 
-                (1 - self.position_smoothing) * self.longitude
+            # Predict: uncertainty grows with the time since the last update
+            dt = max(0.0, timestamp - self.last_update) if self.last_update is not None else 0.0
+            variance = (
+                self.position_variance
+                + self.position_smoothing * POSITION_PROCESS_NOISE_SCALE * dt
             )
-            self.accuracy = (
-                self.position_smoothing * accuracy + 
-                (1 - self.position_smoothing) * self.accuracy
-            )
-            
+
+            # Update: blend in the measurement by the Kalman gain
+            gain = variance / (variance + measurement_variance)
+            self.latitude += gain * (lat - self.latitude)
+            self.longitude += gain * (lng - self.longitude)
+            self.position_variance = (1 - gain) * variance
+
+        self.accuracy = max(1.0, self.position_variance ** 0.5)
         self.last_update = timestamp
 
 
@@ -224,38 +325,35 @@ class Triangulator:
         # Weighted average of circle intersections
         x_sum = 0
         y_sum = 0
+        hypot = math.hypot
+        count = len(xy_points)
         
-        for i, (x1, y1, r1) in enumerate(xy_points):
-            for j in range(i+1, len(xy_points)):
+        for i in range(count):
+            x1, y1, r1 = xy_points[i]
+            w1 = weights[i]
+            for j in range(i+1, count):
                 x2, y2, r2 = xy_points[j]
+                dx = x2 - x1
+                dy = y2 - y1
                 
                 # Distance between centers
-                d = math.sqrt((x2-x1)**2 + (y2-y1)**2)
+                d = hypot(dx, dy)
                 
                 # No solution if circles are too far apart or one contains the other
                 if d > r1 + r2 or d < abs(r1 - r2):
                     continue
                 
-                # Math for circle intersection
-                a = (r1*r1 - r2*r2 + d*d) / (2*d)
-                h = math.sqrt(max(0, r1*r1 - a*a))  # Use max to avoid negative sqrt
-                
-                x3 = x1 + a * (x2 - x1) / d
-                y3 = y1 + a * (y2 - y1) / d
-                
-                # Two intersection points
-                x4_1 = x3 + h * (y2 - y1) / d
-                y4_1 = y3 - h * (x2 - x1) / d
-                
-                x4_2 = x3 - h * (y2 - y1) / d
-                y4_2 = y3 + h * (x2 - x1) / d
+                # The two intersection points are symmetric about the chord midpoint
+                # (x1, y1) + a * (dx, dy) / d, so their average is that midpoint and
+                # the half-chord length never needs to be computed
+                a_over_d = (r1*r1 - r2*r2 + d*d) / (2*d*d)
                 
                 # Calculate the weight for this pair based on distance measurement confidence
-                pair_weight = weights[i] * weights[j]
+                pair_weight = w1 * weights[j]
                 
-                # Add both intersection points with weight
-                x_sum += (x4_1 + x4_2) * pair_weight / 2
-                y_sum += (y4_1 + y4_2) * pair_weight / 2
+                # Add the midpoint of both intersection points with weight
+                x_sum += (x1 + a_over_d * dx) * pair_weight
+                y_sum += (y1 + a_over_d * dy) * pair_weight
         
         # Check if we have any valid intersections
         if x_sum == 0 and y_sum == 0:
@@ -272,10 +370,7 @@ class Triangulator:
             y_result = y_sum / total_weight
             
         # Calculate accuracy from residuals
-        residuals = []
-        for x, y, r in xy_points:
-            actual_dist = math.sqrt((x_result - x)**2 + (y_result - y)**2)
-            residuals.append(abs(actual_dist - r))
+        residuals = [abs(hypot(x_result - x, y_result - y) - r) for x, y, r in xy_points]
             
         # Use the average residual as our accuracy estimate
         if residuals:
@@ -401,10 +496,51 @@ class MQTTHandler:
         # Set for tracking which beacons have been registered via discovery
         self.registered_beacons = set()
 
+        # Pending state publishes (topic -> payload), last write wins; payloads
+        # are bytes when orjson is installed
+        self._pending_publishes: Dict[str, Union[str, bytes]] = {}
+        self._flush_handle = None
+        self._flush_task = None
+
     def mac_to_topic(self, mac: str) -> str:
         """Convert a MAC address to a safe topic name."""
         return f"beacon_{mac.lower().replace(':', '_')}"
 
+    def queue_publish(self, topic: str, payload):
+        """Queue a state publish, coalescing updates to the same topic."""
+        self._pending_publishes[topic] = payload
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                PUBLISH_FLUSH_INTERVAL, self._schedule_flush
+            )
+
+    def _schedule_flush(self):
+        """Start flushing the pending publishes."""
+        self._flush_handle = None
+        self._flush_task = asyncio.ensure_future(self.flush_publishes())
+
+    async def flush_publishes(self):
+        """Publish all pending state messages concurrently."""
+        pending, self._pending_publishes = self._pending_publishes, {}
+        results = await asyncio.gather(
+            *(self.client.publish(topic, payload, qos=0) for topic, payload in pending.items()),
+            return_exceptions=True,
+        )
+        for topic, result in zip(pending, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error publishing to {topic}: {result}")
+
+    async def close(self):
+        """Publish the coalesced state messages that are still pending."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._flush_task is not None:
+            await self._flush_task
+            self._flush_task = None
+        if self._pending_publishes:
+            await self.flush_publishes()
+
     async def process_beacon_message(self, proxy_id: str, payload: dict):
         """Process a BLE beacon message from a proxy."""
         try:
@@ -414,8 +550,11 @@ class MQTTHandler:
             # Parse timestamp or use current time
             ts_str = payload.get("timestamp")
             if ts_str:
-                dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                timestamp = dt.timestamp()
+                try:
+                    # Python 3.11+ parses the "Z" suffix natively in C
+                    timestamp = datetime.fromisoformat(ts_str).timestamp()
+                except ValueError:
+                    timestamp = time.time()
             else:
                 timestamp = time.time()
                 
@@ -449,6 +588,9 @@ class MQTTHandler:
 
     async def register_beacon_discovery(self, mac: str):
         """Register a beacon with Home Assistant via MQTT discovery."""
+        # Claim the beacon before awaiting the publish, so messages handled while
+        # the discovery publish is in flight do not register it again
+        self.registered_beacons.add(mac)
         try:
             beacon = self.beacons[mac]
             topic_name = self.mac_to_topic(mac)
@@ -472,9 +614,10 @@ class MQTTHandler:
             await self.client.publish(discovery_topic, json.dumps(config), qos=1, retain=True)
             
             logger.info(f"Registered beacon {mac} as {beacon.name}")
-            self.registered_beacons.add(mac)
             
         except Exception as e:
+            # Allow a later message to retry the registration
+            self.registered_beacons.discard(mac)
             logger.exception(f"Error registering beacon discovery: {e}")
 
     async def update_beacon_position(self, mac: str):
@@ -489,8 +632,13 @@ class MQTTHandler:
             # Only proceed if we have enough proxies
             if len(distances) < self.min_proxies:
                 return
+
+            # Skip triangulation while the RSSI vector has not changed materially
+            if not beacon.needs_triangulation(len(distances)):
+                return
                 
             # Perform triangulation
+            beacon.mark_triangulated(len(distances))
             lat, lng, accuracy = Triangulator.trilaterate_2d(distances)
             
             if lat is None or lng is None:
@@ -506,14 +654,10 @@ class MQTTHandler:
                 "latitude": beacon.latitude,
                 "longitude": beacon.longitude,
                 "gps_accuracy": beacon.accuracy,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": iso_timestamp(current_time),
             }
             
-            await self.client.publish(
-                f"{MQTT_STATE_PREFIX}/{topic_name}", 
-                json.dumps(payload), 
-                qos=0
-            )
+            self.queue_publish(f"{MQTT_STATE_PREFIX}/{topic_name}", json_dumps(payload))
             
         except Exception as e:
             logger.exception(f"Error updating beacon position: {e}")
@@ -581,31 +725,34 @@ async def main():
                 min_proxies,
             )
             
-            # Subscribe to proxy topics
-            await client.subscribe(f"{MQTT_PROXY_PREFIX}/#")
-            logger.info(f"Subscribed to {MQTT_PROXY_PREFIX}/#")
+            # Subscribe to beacon topics only (<prefix>/<proxy_id>); '+' matches a
+            # single level, so the broker never sends proxy status messages
+            await client.subscribe(f"{MQTT_PROXY_PREFIX}/+")
+            logger.info(f"Subscribed to {MQTT_PROXY_PREFIX}/+")
             
             # Process messages
-            async with client.messages() as messages:
-                async for message in messages:
-                    # Extract proxy ID from topic
-                    topic_parts = message.topic.split("/")
-                    if len(topic_parts) < 2:
-                        continue
-                        
-                    proxy_id = topic_parts[-1]
-                    
-                    try:
-                        payload = json.loads(message.payload)
-                        await handler.process_beacon_message(proxy_id, payload)
-                    except json.JSONDecodeError:
-                        logger.error(f"Invalid JSON payload: {message.payload}")
-                    except Exception as e:
-                        logger.exception(f"Error processing message: {e}")
+            try:
+                async with client.messages() as messages:
+                    async for message in messages:
+                        # Extract proxy ID (last topic level) without building a list
+                        _, sep, proxy_id = message.topic.rpartition("/")
+                        if not sep or not proxy_id:
+                            continue
                         
-                    # Check if we should stop
-                    if stop_event.is_set():
-                        break
+                        try:
+                            payload = json_loads(message.payload)
+                            await handler.process_beacon_message(proxy_id, payload)
+                        except json.JSONDecodeError:
+                            logger.error(f"Invalid JSON payload: {message.payload}")
+                        except Exception as e:
+                            logger.exception(f"Error processing message: {e}")
+                            
+                        # Check if we should stop
+                        if stop_event.is_set():
+                            break
+            finally:
+                # Send the coalesced positions before the client disconnects
+                await handler.close()
     
     except mqtt.MqttError as e:
         logger.error(f"MQTT Error: {e}")
@@ -619,6 +766,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Import math here to avoid circular import in class definitions
-    import math
     sys.exit(asyncio.run(main()))
\ No newline at end of file